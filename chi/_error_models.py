@@ -836,13 +836,12 @@ class GaussianErrorModel(ErrorModel):
         # Get parameters
         sigma = parameters[0]
 
-        # Sample from Gaussian distributions
+        # Sample from Gaussian distributions centered at the model output
+        # (Broadcasting the model output as location avoids an additional
+        # pass over the samples)
         rng = np.random.default_rng(seed=seed)
-        samples = rng.normal(loc=0, scale=sigma, size=sample_shape)
-
-        # Construct final samples
         model_output = np.expand_dims(model_output, axis=1)
-        samples = model_output + samples
+        samples = rng.normal(loc=model_output, scale=sigma, size=sample_shape)
 
         return samples
 
@@ -1605,8 +1604,8 @@ class ReducedErrorModel(object):
         self._error_model = error_model
 
         # Set defaults
-        self._fixed_params_mask = None
         self._fixed_params_values = None
+        self._free_params_indices = None
         self._n_parameters = error_model.n_parameters()
         self._parameter_names = error_model.get_parameter_names()
 
@@ -1648,8 +1647,8 @@ class ReducedErrorModel(object):
             An array-like object with the measured values.
         """
         # Get fixed parameter values
-        if self._fixed_params_mask is not None:
-            self._fixed_params_values[~self._fixed_params_mask] = parameters
+        if self._free_params_indices is not None:
+            self._fixed_params_values[self._free_params_indices] = parameters
             parameters = self._fixed_params_values
 
         score = self._error_model.compute_log_likelihood(
@@ -1693,8 +1692,8 @@ class ReducedErrorModel(object):
             An array-like object with the measured values.
         """
         # Get fixed parameter values
-        if self._fixed_params_mask is not None:
-            self._fixed_params_values[~self._fixed_params_mask] = parameters
+        if self._free_params_indices is not None:
+            self._fixed_params_values[self._free_params_indices] = parameters
             parameters = self._fixed_params_values
 
         pointwise_ll = self._error_model.compute_pointwise_ll(
@@ -1732,22 +1731,23 @@ class ReducedErrorModel(object):
         :type observations: list, numpy.ndarray of length t
         """
         # Get fixed parameter values
-        if self._fixed_params_mask is not None:
-            self._fixed_params_values[~self._fixed_params_mask] = parameters
+        if self._free_params_indices is not None:
+            self._fixed_params_values[self._free_params_indices] = parameters
             parameters = self._fixed_params_values
 
         score, sensitivities = self._error_model.compute_sensitivities(
             parameters, model_output, model_sensitivities, observations)
 
-        if self._fixed_params_mask is None:
+        if self._free_params_indices is None:
             return score, sensitivities
 
         # Filter sensitivities for fixed parameters
         n_mechanistic = model_sensitivities.shape[1]
-        mask = np.ones(n_mechanistic + self._n_parameters, dtype=bool)
-        mask[-self._n_parameters:] = ~self._fixed_params_mask
+        indices = np.hstack((
+            np.arange(n_mechanistic),
+            n_mechanistic + self._free_params_indices))
 
-        return score, sensitivities[mask]
+        return score, sensitivities[indices]
 
     def fix_parameters(self, name_value_dict):
         """
@@ -1769,14 +1769,15 @@ class ReducedErrorModel(object):
                 'The name-value dictionary has to be convertable to a python '
                 'dictionary.')
 
-        # If no model parameters have been fixed before, instantiate a mask
-        # and values
-        if self._fixed_params_mask is None:
-            self._fixed_params_mask = np.zeros(
-                shape=self._n_parameters, dtype=bool)
-
+        # If no model parameters have been fixed before, instantiate values
         if self._fixed_params_values is None:
-            self._fixed_params_values = np.empty(shape=self._n_parameters)
+            self._fixed_params_values = np.zeros(shape=self._n_parameters)
+
+        # Get mask of fixed parameters
+        fixed_params_mask = np.zeros(shape=self._n_parameters, dtype=bool)
+        if self._free_params_indices is not None:
+            fixed_params_mask[:] = True
+            fixed_params_mask[self._free_params_indices] = False
 
         # Update the mask and values
         for index, name in enumerate(self._parameter_names):
@@ -1787,13 +1788,16 @@ class ReducedErrorModel(object):
                 continue
 
             # Fix parameter if value is not None, else unfix it
-            self._fixed_params_mask[index] = value is not None
+            fixed_params_mask[index] = value is not None
             self._fixed_params_values[index] = value
 
-        # If all parameters are free, set mask and values to None again
-        if np.all(~self._fixed_params_mask):
-            self._fixed_params_mask = None
+        # If all parameters are free, set values and indices to None again
+        if not np.any(fixed_params_mask):
             self._fixed_params_values = None
+            self._free_params_indices = None
+        else:
+            # Remember only the indices of the free parameters
+            self._free_params_indices = np.flatnonzero(~fixed_params_mask)
 
     def get_error_model(self):
         """
@@ -1807,9 +1811,9 @@ class ReducedErrorModel(object):
         """
         # Remove fixed model parameters
         names = self._parameter_names
-        if self._fixed_params_mask is not None:
+        if self._free_params_indices is not None:
             names = np.array(names)
-            names = names[~self._fixed_params_mask]
+            names = names[self._free_params_indices]
             names = list(names)
 
         return copy.copy(names)
@@ -1818,10 +1822,10 @@ class ReducedErrorModel(object):
         """
         Returns the number of fixed model parameters.
         """
-        if self._fixed_params_mask is None:
+        if self._free_params_indices is None:
             return 0
 
-        n_fixed = int(np.sum(self._fixed_params_mask))
+        n_fixed = self._n_parameters - len(self._free_params_indices)
 
         return n_fixed
 
@@ -1829,15 +1833,10 @@ class ReducedErrorModel(object):
         """
         Returns the number of parameters of the error model.
         """
-        # Get number of fixed parameters
-        n_fixed = 0
-        if self._fixed_params_mask is not None:
-            n_fixed = int(np.sum(self._fixed_params_mask))
-
-        # Subtract fixed parameters from total number
-        n_parameters = self._n_parameters - n_fixed
+        if self._free_params_indices is None:
+            return self._n_parameters
 
-        return n_parameters
+        return len(self._free_params_indices)
 
     def sample(self, parameters, model_output, n_samples=None, seed=None):
         """
@@ -1859,8 +1858,8 @@ class ReducedErrorModel(object):
             pseudo-random number generator is not seeded.
         """
         # Get fixed parameter values
-        if self._fixed_params_mask is not None:
-            self._fixed_params_values[~self._fixed_params_mask] = parameters
+        if self._free_params_indices is not None:
+            self._fixed_params_values[self._free_params_indices] = parameters
             parameters = self._fixed_params_values
 
         # Sample from error model
@@ -1899,10 +1898,10 @@ class ReducedErrorModel(object):
         parameter_names = [str(label) for label in names]
 
         # Reconstruct full list of error model parameters
-        if self._fixed_params_mask is not None:
+        if self._free_params_indices is not None:
             names = np.array(
                 self._error_model.get_parameter_names(), dtype='U50')
-            names[~self._fixed_params_mask] = parameter_names
+            names[self._free_params_indices] = parameter_names
             parameter_names = names
 
         # Set parameter names
@@ -886,8 +886,8 @@ class ReducedMechanisticModel(MechanisticModel):
         self._mechanistic_model = mechanistic_model
 
         # Set defaults
-        self._fixed_params_mask = None
         self._fixed_params_values = None
+        self._free_params_indices = None
         self._n_parameters = mechanistic_model.n_parameters()
         self._parameter_names = mechanistic_model.parameters()
 
@@ -939,8 +939,8 @@ class ReducedMechanisticModel(MechanisticModel):
 
         # Get free parameters
         free_parameters = np.array(self._parameter_names)
-        if self._fixed_params_mask is not None:
-            free_parameters = free_parameters[~self._fixed_params_mask]
+        if self._free_params_indices is not None:
+            free_parameters = free_parameters[self._free_params_indices]
 
         # Set sensitivities
         self._mechanistic_model.enable_sensitivities(
@@ -966,14 +966,15 @@ class ReducedMechanisticModel(MechanisticModel):
                 'The name-value dictionary has to be convertable to a python '
                 'dictionary.')
 
-        # If no model parameters have been fixed before, instantiate a mask
-        # and values
-        if self._fixed_params_mask is None:
-            self._fixed_params_mask = np.zeros(
-                shape=self._n_parameters, dtype=bool)
-
+        # If no model parameters have been fixed before, instantiate values
         if self._fixed_params_values is None:
-            self._fixed_params_values = np.empty(shape=self._n_parameters)
+            self._fixed_params_values = np.zeros(shape=self._n_parameters)
+
+        # Get mask of fixed parameters
+        fixed_params_mask = np.zeros(shape=self._n_parameters, dtype=bool)
+        if self._free_params_indices is not None:
+            fixed_params_mask[:] = True
+            fixed_params_mask[self._free_params_indices] = False
 
         # Update the mask and values
         for index, name in enumerate(self._parameter_names):
@@ -984,13 +985,16 @@ class ReducedMechanisticModel(MechanisticModel):
                 continue
 
             # Fix parameter if value is not None, else unfix it
-            self._fixed_params_mask[index] = value is not None
+            fixed_params_mask[index] = value is not None
             self._fixed_params_values[index] = value
 
-        # If all parameters are free, set mask and values to None again
-        if np.all(~self._fixed_params_mask):
-            self._fixed_params_mask = None
+        # If all parameters are free, set values and indices to None again
+        if not np.any(fixed_params_mask):
             self._fixed_params_values = None
+            self._free_params_indices = None
+        else:
+            # Remember only the indices of the free parameters
+            self._free_params_indices = np.flatnonzero(~fixed_params_mask)
 
         # Remove sensitivities for fixed parameters
         if self.has_sensitivities() is True:
@@ -1012,10 +1016,10 @@ class ReducedMechanisticModel(MechanisticModel):
         """
         Returns the number of fixed model parameters.
         """
-        if self._fixed_params_mask is None:
+        if self._free_params_indices is None:
             return 0
 
-        n_fixed = int(np.sum(self._fixed_params_mask))
+        n_fixed = self._n_parameters - len(self._free_params_indices)
 
         return n_fixed
 
@@ -1034,15 +1038,10 @@ class ReducedMechanisticModel(MechanisticModel):
         Parameters of the model are initial state values and structural
         parameter values.
         """
-        # Get number of fixed parameters
-        n_fixed = 0
-        if self._fixed_params_mask is not None:
-            n_fixed = int(np.sum(self._fixed_params_mask))
-
-        # Subtract fixed parameters from total number
-        n_parameters = self._n_parameters - n_fixed
+        if self._free_params_indices is None:
+            return self._n_parameters
 
-        return n_parameters
+        return len(self._free_params_indices)
 
     def outputs(self):
         """
@@ -1056,9 +1055,9 @@ class ReducedMechanisticModel(MechanisticModel):
         """
         # Remove fixed model parameters
         names = self._parameter_names
-        if self._fixed_params_mask is not None:
+        if self._free_params_indices is not None:
             names = np.array(names)
-            names = names[~self._fixed_params_mask]
+            names = names[self._free_params_indices]
             names = list(names)
 
         return copy.copy(names)
@@ -1178,9 +1177,9 @@ class ReducedMechanisticModel(MechanisticModel):
             (n_times, n_outputs, n_parameters)
         """
         # Insert fixed parameter values
-        if self._fixed_params_mask is not None:
+        if self._free_params_indices is not None:
             self._fixed_params_values[
-                ~self._fixed_params_mask] = parameters
+                self._free_params_indices] = parameters
             parameters = self._fixed_params_values
 
         return self._mechanistic_model.simulate(parameters, times)
@@ -3086,8 +3086,8 @@ class ReducedPopulationModel(PopulationModel):
         self._population_model = population_model
 
         # Set defaults
-        self._fixed_params_mask = None
         self._fixed_params_values = None
+        self._free_params_indices = None
         self._n_parameters = population_model.n_parameters()
         self._n_dim = population_model.n_dim()
         self._n_covariates = population_model.n_covariates()
@@ -3108,8 +3108,8 @@ class ReducedPopulationModel(PopulationModel):
         :rtype: np.ndarray of shape ``(n_ids, n_dim)``
         """
         # Get fixed parameter values
-        if self._fixed_params_mask is not None:
-            self._fixed_params_values[~self._fixed_params_mask] = parameters
+        if self._free_params_indices is not None:
+            self._fixed_params_values[self._free_params_indices] = parameters
             parameters = self._fixed_params_values
 
         return self._population_model.compute_individual_parameters(
@@ -3129,8 +3129,8 @@ class ReducedPopulationModel(PopulationModel):
         """
         parameters = np.asarray(parameters).flatten()
         # Get fixed parameter values
-        if self._fixed_params_mask is not None:
-            self._fixed_params_values[~self._fixed_params_mask] = parameters
+        if self._free_params_indices is not None:
+            self._fixed_params_values[self._free_params_indices] = parameters
             parameters = self._fixed_params_values
 
         # Compute log-likelihood
@@ -3159,8 +3159,8 @@ class ReducedPopulationModel(PopulationModel):
     #     # Also needs to be adapted to match multi-dimensional API.
     #     raise NotImplementedError
     #     # # Get fixed parameter values
-    #     # if self._fixed_params_mask is not None:
-    #     #     self._fixed_params_values[~self._fixed_params_mask] = \
+    #     # if self._free_params_indices is not None:
+    #     #     self._fixed_params_values[self._free_params_indices] = \
     #               parameters
     #     #     parameters = self._fixed_params_values
 
@@ -3204,8 +3204,8 @@ class ReducedPopulationModel(PopulationModel):
         """
         parameters = np.asarray(parameters).flatten()
         # Get fixed parameter values
-        if self._fixed_params_mask is not None:
-            self._fixed_params_values[~self._fixed_params_mask] = parameters
+        if self._free_params_indices is not None:
+            self._fixed_params_values[self._free_params_indices] = parameters
             parameters = self._fixed_params_values
 
         # Compute log-likelihood and sensitivities
@@ -3217,19 +3217,19 @@ class ReducedPopulationModel(PopulationModel):
             reduce=reduce,
             **kwargs)
 
-        if self._fixed_params_mask is None:
+        if self._free_params_indices is None:
             return output
 
         # Need to filter sensitivities of fixed top-level parameters
         if not reduce:
             score, dpsi, dtheta = output
-            return score, dpsi, dtheta[~self._fixed_params_mask]
+            return score, dpsi, dtheta[self._free_params_indices]
 
         score, dscore = output
         n_bottom, _ = self._population_model.n_hierarchical_parameters(
             len(observations))
         dpsi = dscore[:n_bottom]
-        dtheta = dscore[n_bottom:][~self._fixed_params_mask]
+        dtheta = dscore[n_bottom:][self._free_params_indices]
 
         return score, np.hstack((dpsi, dtheta))
 
@@ -3251,14 +3251,15 @@ class ReducedPopulationModel(PopulationModel):
                 'The name-value dictionary has to be convertable to a python '
                 'dictionary.')
 
-        # If no model parameters have been fixed before, instantiate a mask
-        # and values
-        if self._fixed_params_mask is None:
-            self._fixed_params_mask = np.zeros(
-                shape=self._n_parameters, dtype=bool)
-
+        # If no model parameters have been fixed before, instantiate values
         if self._fixed_params_values is None:
-            self._fixed_params_values = np.empty(shape=self._n_parameters)
+            self._fixed_params_values = np.zeros(shape=self._n_parameters)
+
+        # Get mask of fixed parameters
+        fixed_params_mask = np.zeros(shape=self._n_parameters, dtype=bool)
+        if self._free_params_indices is not None:
+            fixed_params_mask[:] = True
+            fixed_params_mask[self._free_params_indices] = False
 
         # Update the mask and values
         for index, name in enumerate(
@@ -3270,13 +3271,16 @@ class ReducedPopulationModel(PopulationModel):
                 continue
 
             # Fix parameter if value is not None, else unfix it
-            self._fixed_params_mask[index] = value is not None
+            fixed_params_mask[index] = value is not None
             self._fixed_params_values[index] = value
 
-        # If all parameters are free, set mask and values to None again
-        if np.all(~self._fixed_params_mask):
-            self._fixed_params_mask = None
+        # If all parameters are free, set values and indices to None again
+        if not np.any(fixed_params_mask):
             self._fixed_params_values = None
+            self._free_params_indices = None
+        else:
+            # Remember only the indices of the free parameters
+            self._free_params_indices = np.flatnonzero(~fixed_params_mask)
 
     def get_covariate_names(self):
         """
@@ -3307,7 +3311,7 @@ class ReducedPopulationModel(PopulationModel):
         special_dims, n_pooled_dims, n_hetero_dims = \
             self._population_model.get_special_dims()
 
-        if self._fixed_params_mask is None:
+        if self._free_params_indices is None:
             return special_dims, n_pooled_dims, n_hetero_dims
 
         # If parameters are fixed, we need to reindex top level parameters
@@ -3316,9 +3320,10 @@ class ReducedPopulationModel(PopulationModel):
             start = s[2]
             end = s[3]
 
-            # Shift by number of leading fixed parameters
-            start -= int(np.sum(self._fixed_params_mask[:start]))
-            end -= int(np.sum(self._fixed_params_mask[:end]))
+            # Shift by number of leading fixed parameters, i.e. count the
+            # leading free parameters
+            start = np.count_nonzero(self._free_params_indices < start)
+            end = np.count_nonzero(self._free_params_indices < end)
             s_dims += [[
                 s[0], s[1], start, end, s[4]
             ]]
@@ -3333,9 +3338,9 @@ class ReducedPopulationModel(PopulationModel):
         names = self._population_model.get_parameter_names(exclude_dim_names)
 
         # Remove fixed model parameters
-        if self._fixed_params_mask is not None:
+        if self._free_params_indices is not None:
             names = np.array(names)
-            names = names[~self._fixed_params_mask]
+            names = names[self._free_params_indices]
             names = list(names)
 
         return copy.copy(names)
@@ -3364,9 +3369,8 @@ class ReducedPopulationModel(PopulationModel):
 
         # If parameters have been fixed, updated number of population
         # parameters
-        if self._fixed_params_mask is not None:
-            n_fixed = int(np.sum(self._fixed_params_mask))
-            n_pop = self._n_parameters - n_fixed
+        if self._free_params_indices is not None:
+            n_pop = len(self._free_params_indices)
 
         return (n_indiv, n_pop)
 
@@ -3374,10 +3378,10 @@ class ReducedPopulationModel(PopulationModel):
         """
         Returns the number of fixed model parameters.
         """
-        if self._fixed_params_mask is None:
+        if self._free_params_indices is None:
             return 0
 
-        n_fixed = int(np.sum(self._fixed_params_mask))
+        n_fixed = self._n_parameters - len(self._free_params_indices)
 
         return n_fixed
 
@@ -3385,15 +3389,10 @@ class ReducedPopulationModel(PopulationModel):
         """
         Returns the number of parameters of the population model.
         """
-        # Get number of fixed parameters
-        n_fixed = 0
-        if self._fixed_params_mask is not None:
-            n_fixed = int(np.sum(self._fixed_params_mask))
+        if self._free_params_indices is None:
+            return self._n_parameters
 
-        # Subtract fixed parameters from total number
-        n_parameters = self._n_parameters - n_fixed
-
-        return n_parameters
+        return len(self._free_params_indices)
 
     def sample(self, parameters, n_samples=None, seed=None, *args, **kwargs):
         """
@@ -3411,8 +3410,8 @@ class ReducedPopulationModel(PopulationModel):
         :type seed: int, optional
         """
         # Get fixed parameter values
-        if self._fixed_params_mask is not None:
-            self._fixed_params_values[~self._fixed_params_mask] = parameters
+        if self._free_params_indices is not None:
+            self._fixed_params_values[self._free_params_indices] = parameters
             parameters = self._fixed_params_values
 
         # Sample from population model
@@ -3487,10 +3486,10 @@ class ReducedPopulationModel(PopulationModel):
         parameter_names = [str(label) for label in names]
 
         # Reconstruct full list of error model parameters
-        if self._fixed_params_mask is not None:
+        if self._free_params_indices is not None:
             names = np.array(
                 self._population_model.get_parameter_names(), dtype='U50')
-            names[~self._fixed_params_mask] = parameter_names
+            names[self._free_params_indices] = parameter_names
             parameter_names = names
 
         # Set parameter names
@@ -15,6 +15,71 @@ import xarray as xr
 import chi
 
 
+def _broadcast_covariates(covariates, n_samples):
+    """
+    Returns the covariates as an array of shape ``(n_samples, n_cov)``.
+
+    If no covariates are provided, ``None`` is returned.
+    """
+    if covariates is None:
+        return None
+
+    covariates = np.asarray(covariates)
+    if covariates.ndim == 1:
+        covariates = covariates[np.newaxis, :]
+    n_s, n_c = covariates.shape
+    if (n_s > 1) and (n_s != n_samples):
+        raise ValueError(
+            'Provided covariates cannot be broadcasted to number of '
+            'samples.')
+
+    return np.broadcast_to(covariates, shape=(n_samples, n_c))
+
+
+def _ensure_sorted(times):
+    """
+    Returns the times in ascending order.
+
+    Times that are already sorted are returned without sorting them again.
+    """
+    times = np.asarray(times)
+    if np.all(times[1:] >= times[:-1]):
+        return times
+
+    return np.sort(times)
+
+
+def _get_row(array, index):
+    """
+    Returns the row of an array, or ``None`` if the array is ``None``.
+    """
+    if array is None:
+        return None
+
+    return array[index]
+
+
+def _get_container(out, shape):
+    """
+    Returns a container for samples of the given shape.
+
+    If ``out`` is ``None`` a new array is allocated, otherwise ``out`` is
+    returned after checking its shape and type.
+    """
+    if out is None:
+        return np.empty(shape=shape)
+
+    if not isinstance(out, np.ndarray) or (out.dtype != float):
+        raise TypeError(
+            'The output container has to be a numpy.ndarray of floats.')
+    if out.shape != shape:
+        raise ValueError(
+            'The shape of the output container has to be <' + str(shape)
+            + '>.')
+
+    return out
+
+
 class AveragedPredictiveModel(object):
     """
     A base class for predictive models whose parameters are drawn from
@@ -81,10 +146,14 @@ class AveragedPredictiveModel(object):
         return self._predictive_model
 
     def sample(
-            self, times, n_samples=None, seed=None, include_regimen=False):
+            self, times, n_samples=None, seed=None, include_regimen=False,
+            return_df=True):
         """
         Samples virtual measurements from the model of the data-generating
         process and returns them in form of a :class:`pandas.DataFrame`.
+
+        If ``return_df=False``, the samples are returned as a
+        :class:`numpy.ndarray` of shape ``(n_outputs, n_times, n_samples)``.
         """
         raise NotImplementedError
 
@@ -223,10 +292,11 @@ class PosteriorPredictiveModel(AveragedPredictiveModel):
 
     def sample(
             self, times, n_samples=None, individual=None, seed=None,
-            include_regimen=False, covariates=None):
+            include_regimen=False, covariates=None, return_df=True):
         """
         Samples virtual measurements from the posterior predictive
-        model and returns them in form of a :class:`pandas.DataFrame`.
+        model and returns them in form of a :class:`pandas.DataFrame` or a
+        :class:`numpy.ndarray`.
 
         For each of the ``n_samples`` a parameter set is drawn from the
         approximate posterior distribution. These paramaters are then used to
@@ -251,12 +321,18 @@ class PosteriorPredictiveModel(AveragedPredictiveModel):
             subpopulation.
         :type covariates: List, np.ndarray of shape ``(n_cov,)`` or
             ``(n_samples, n_cov)``, optional
-        :rtype: :class:`pandas.DataFrame`
+        :param return_df: A boolean flag which determines whether the output is
+            returned as a :class:`pandas.DataFrame` or a
+            :class:`numpy.ndarray`.
+        :type return_df: bool, optional
+        :rtype: :class:`pandas.DataFrame` or np.ndarray of shape
+            ``(n_outputs, n_times, n_samples)``
         """
         # Make sure n_samples is an integer
         if n_samples is None:
             n_samples = 1
         n_samples = int(n_samples)
+        covariates = _broadcast_covariates(covariates, n_samples)
 
         # Check individual for population model
         if isinstance(self._predictive_model, chi.PopulationPredictiveModel):
@@ -282,7 +358,7 @@ class PosteriorPredictiveModel(AveragedPredictiveModel):
                     'found in the ID column.')
 
         # Sort times
-        times = np.sort(times)
+        times = _ensure_sorted(times)
 
         # Instantiate random number generator for sampling from the posterior
         rng = np.random.default_rng(seed=seed)
@@ -308,12 +384,11 @@ class PosteriorPredictiveModel(AveragedPredictiveModel):
                 posterior[:, param_id] = self._posterior[
                     parameter].dropna(dim='draw').values.flatten()
 
-        # Create container for samples
-        container = pd.DataFrame(
-            columns=['ID', 'Time', 'Observable', 'Value'])
-
-        # Get model outputs
+        # Create numpy container for samples
         outputs = self._predictive_model.get_output_names()
+        n_outputs = len(outputs)
+        n_times = len(times)
+        samples = np.empty(shape=(n_samples, n_outputs, n_times))
 
         # Draw samples
         sample_ids = np.arange(start=1, stop=n_samples+1)
@@ -321,25 +396,32 @@ class PosteriorPredictiveModel(AveragedPredictiveModel):
             # Sample parameter from posterior
             parameters = rng.choice(posterior)
 
-            # Sample from predictive model
-            sample = self._predictive_model.sample(
-                parameters, times, n_samples, rng, return_df=False,
-                covariates=covariates)
+            # Sample one measurement from predictive model
+            # (Samples are written directly into the container)
+            self._predictive_model.sample(
+                parameters, times, n_samples=1, seed=rng, return_df=False,
+                covariates=_get_row(covariates, sample_id - 1),
+                out=samples[sample_id - 1, ..., np.newaxis])
 
-            # Append samples to dataframe
-            for output_id, name in enumerate(outputs):
-                container = pd.concat([container, pd.DataFrame({
-                    'ID': sample_id,
-                    'Time': times,
-                    'Observable': name,
-                    'Value': sample[output_id, :, 0]})])
+        if return_df is False:
+            # Return samples in numpy array format
+            return np.moveaxis(samples, 0, -1)
+
+        # Structure samples in a pandas.DataFrame
+        # (Exploit how .flatten() arranges samples)
+        container = pd.DataFrame({
+            'ID': np.repeat(sample_ids, n_outputs * n_times),
+            'Time': np.tile(times, n_samples * n_outputs),
+            'Observable': np.tile(np.repeat(outputs, n_times), n_samples),
+            'Value': samples.flatten()})
 
         # Add dosing regimen, if set
-        final_time = np.max(times)
-        regimen = self.get_dosing_regimen(final_time)
-        if (regimen is not None) and (include_regimen is True):
-            # Append dosing regimen only once for all samples
-            container = pd.concat([container, regimen])
+        if include_regimen:
+            final_time = np.max(times)
+            regimen = self.get_dosing_regimen(final_time)
+            if regimen is not None:
+                # Append dosing regimen only once for all samples
+                container = pd.concat([container, regimen])
 
         return container
 
@@ -412,6 +494,10 @@ class PredictiveModel(object):
         self._mechanistic_model = mechanistic_model
         self._error_models = error_models
 
+        # Remember outputs
+        self._output_names = mechanistic_model.outputs()
+        self._n_outputs = n_outputs
+
         # Set parameter names and number of parameters
         self._set_error_model_parameter_names()
         self._set_number_and_parameter_names()
@@ -426,10 +512,9 @@ class PredictiveModel(object):
             error_model.set_parameter_names(None)
 
         # Rename error model parameters, if more than one output
-        n_outputs = self._mechanistic_model.n_outputs()
-        if n_outputs > 1:
+        if self._n_outputs > 1:
             # Get output names
-            outputs = self._mechanistic_model.outputs()
+            outputs = self._output_names
 
             for output_id, error_model in enumerate(self._error_models):
                 # Get original parameter names
@@ -444,14 +529,28 @@ class PredictiveModel(object):
 
     def _set_number_and_parameter_names(self):
         """
-        Sets the number and names of the free model parameters.
+        Sets the number and names of the free model parameters, and remembers
+        how the parameters are split across the submodels.
+
+        The sample methods of the error models are cached alongside, so they
+        do not have to be looked up for each output whenever the model is
+        sampled.
         """
         # Get mechanistic model parameters
         parameter_names = self._mechanistic_model.parameters()
+        self._n_mechanistic_parameters = len(parameter_names)
 
         # Get error model parameters
+        self._error_param_slices = []
+        self._error_sample_methods = []
+        start_index = 0
         for error_model in self._error_models:
-            parameter_names += error_model.get_parameter_names()
+            names = error_model.get_parameter_names()
+            end_index = start_index + len(names)
+            self._error_param_slices.append(slice(start_index, end_index))
+            self._error_sample_methods.append(error_model.sample)
+            parameter_names += names
+            start_index = end_index
 
         # Update number and names
         self._parameter_names = parameter_names
@@ -552,8 +651,8 @@ class PredictiveModel(object):
         if final_time is None:
             final_time = np.inf
 
-        # Sort regimen into dataframe
-        regimen_df = pd.DataFrame(columns=['Time', 'Duration', 'Dose'])
+        # Collect dose events as float arrays and build the dataframe once
+        times, durations, doses = [], [], []
         for dose_event in regimen.events():
             # Get dose amount
             dose_rate = dose_event.level()
@@ -572,54 +671,44 @@ class PredictiveModel(object):
 
             if period == 0:
                 # Dose is administered only once
-                regimen_df = pd.concat([regimen_df, pd.DataFrame({
-                    'Time': [start_time],
-                    'Duration': [dose_duration],
-                    'Dose': [dose_amount]})])
-
-                # Continue to next dose event
-                continue
-
-            if n_doses == 0:
+                n_doses = 1
+            elif np.isfinite(final_time):
+                # Make sure that the final time is not exceeded, also for
+                # dose events that would be administered indefinitely
+                n_max = int((final_time - start_time) // period) + 1
+                n_doses = n_max if n_doses == 0 else min(n_doses, n_max)
+            elif n_doses == 0:
                 # The dose event would be administered indefinitely, so we
-                # stop with final_time or 1.
+                # only register the first dose
                 n_doses = 1
 
-                if np.isfinite(final_time):
-                    n_doses = int(abs(final_time) // period)
-
-            # Construct dose times
-            dose_times = [start_time + n * period for n in range(n_doses)]
-
-            # Make sure that even for finite periodic dose events the final
-            # time is not exceeded
-            dose_times = np.array(dose_times)
-            mask = dose_times <= final_time
-            dose_times = dose_times[mask]
-
-            # Add dose administrations to dataframe
-            regimen_df = pd.concat([regimen_df, pd.DataFrame({
-                'Time': dose_times,
-                'Duration': dose_duration,
-                'Dose': dose_amount})])
+            # Add dose administrations
+            times.append(start_time + np.arange(n_doses, dtype=float) * period)
+            durations.append(np.full(n_doses, dose_duration, dtype=float))
+            doses.append(np.full(n_doses, dose_amount, dtype=float))
 
         # If no dose event before final_time exist, return None
-        if regimen_df.empty:
+        if not times:
             return None
 
+        regimen_df = pd.DataFrame({
+            'Time': np.concatenate(times),
+            'Duration': np.concatenate(durations),
+            'Dose': np.concatenate(doses)})
+
         return regimen_df
 
     def get_n_outputs(self):
         """
         Returns the number of outputs.
         """
-        return self._mechanistic_model.n_outputs()
+        return self._n_outputs
 
     def get_output_names(self):
         """
         Returns the output names.
         """
-        return self._mechanistic_model.outputs()
+        return copy.copy(self._output_names)
 
     def get_parameter_names(self):
         """
@@ -658,7 +747,8 @@ class PredictiveModel(object):
 
     def sample(
             self, parameters, times, n_samples=None, seed=None,
-            return_df=True, include_regimen=False, *args, **kwargs):
+            return_df=True, include_regimen=False, out=None, *args,
+            **kwargs):
         """
         Samples "measurements" of the biomarkers from the predictive model and
         returns them in form of a :class:`pandas.DataFrame` or a
@@ -696,6 +786,11 @@ class PredictiveModel(object):
             information is included in the output. If the samples are returned
             as a :class:`numpy.ndarray`, the dosing information is not
             included.
+        out
+            An optional :class:`numpy.ndarray` of shape
+            ``(n_outputs, n_times, n_samples)`` into which the samples are
+            written. This avoids the allocation of a new array when the model
+            is sampled repeatedly.
         """
         parameters = np.asarray(parameters)
         if len(parameters) != self._n_parameters:
@@ -703,61 +798,57 @@ class PredictiveModel(object):
                 'The length of parameters does not match n_parameters.')
 
         # Sort parameters into mechanistic model params and error params
-        n_parameters = self._mechanistic_model.n_parameters()
+        n_parameters = self._n_mechanistic_parameters
         mechanistic_params = parameters[:n_parameters]
         error_params = parameters[n_parameters:]
 
         # Solve mechanistic model
-        times = np.sort(times)
+        times = _ensure_sorted(times)
         outputs = self._mechanistic_model.simulate(mechanistic_params, times)
         # Create numpy container for samples
-        n_outputs = len(outputs)
+        n_outputs = self._n_outputs
         n_times = len(times)
         n_samples = n_samples if n_samples is not None else 1
-        container = np.empty(shape=(n_outputs, n_times, n_samples))
+        container = _get_container(out, shape=(n_outputs, n_times, n_samples))
 
-        # Sample error around mechanistic model outputs
-        start_index = 0
-        for output_id, error_model in enumerate(self._error_models):
-            end_index = start_index + error_model.n_parameters()
+        # Create one random number generator for all outputs
+        # (Passing the seed on to each error model would correlate the noise
+        # across outputs)
+        seed = np.random.default_rng(seed)
 
-            # Sample
-            container[output_id, ...] = error_model.sample(
-                parameters=error_params[start_index:end_index],
+        # Sample error around mechanistic model outputs
+        error_models = zip(
+            self._error_sample_methods, self._error_param_slices)
+        for output_id, (sample, param_slice) in enumerate(error_models):
+            container[output_id, ...] = sample(
+                parameters=error_params[param_slice],
                 model_output=outputs[output_id],
                 n_samples=n_samples,
                 seed=seed)
 
-            # Update start index
-            start_index = end_index
-
         if return_df is False:
             # Return samples in numpy array format
             return container
 
         # Structure samples in a pandas.DataFrame
-        output_names = self._mechanistic_model.outputs()
+        # (Exploit how .flatten() arranges samples)
+        output_names = self._output_names
         sample_ids = np.arange(start=1, stop=n_samples+1)
-        samples = pd.DataFrame(
-            columns=['ID', 'Time', 'Observable', 'Value'])
-
-        # Fill in all samples at a specific time point at once
-        for output_id, name in enumerate(output_names):
-            for time_id, time in enumerate(times):
-                samples = pd.concat([samples, pd.DataFrame({
-                    'ID': sample_ids,
-                    'Time': time,
-                    'Observable': name,
-                    'Value': container[output_id, time_id, :]})])
+        samples = pd.DataFrame({
+            'ID': np.tile(sample_ids, n_outputs * n_times),
+            'Time': np.tile(np.repeat(times, n_samples), n_outputs),
+            'Observable': np.repeat(output_names, n_times * n_samples),
+            'Value': container.flatten()})
 
         # Add dosing regimen information, if set
-        final_time = np.max(times)
-        regimen = self.get_dosing_regimen(final_time)
-        if (regimen is not None) and (include_regimen is True):
-            # Add dosing regimen for each sample
-            for _id in sample_ids:
-                regimen['ID'] = _id
-                samples = pd.concat([samples, regimen])
+        if include_regimen:
+            final_time = np.max(times)
+            regimen = self.get_dosing_regimen(final_time)
+            if regimen is not None:
+                # Add dosing regimen for each sample
+                for _id in sample_ids:
+                    regimen['ID'] = _id
+                    samples = pd.concat([samples, regimen])
 
         return samples
 
@@ -950,7 +1041,7 @@ class PopulationPredictiveModel(PredictiveModel):
 
     def sample(
             self, parameters, times, n_samples=None, seed=None, return_df=True,
-            include_regimen=False, covariates=None):
+            include_regimen=False, covariates=None, out=None):
         """
         Samples measurements of the observables from virtual patients.
 
@@ -984,6 +1075,10 @@ class PopulationPredictiveModel(PredictiveModel):
             subpopulation.
         :type covariates: List, np.ndarray of shape ``(n_cov,)`` or
             ``(n_samples, n_cov)``, optional
+        :param out: Array into which the samples are written. Avoids the
+            allocation of a new array when the model is sampled repeatedly.
+        :type out: np.ndarray of shape ``(n_outputs, n_times, n_samples)``,
+            optional
         :rtype: :class:`pandas.DataFrame` or np.ndarray of shape
             ``(n_outputs, n_times, n_samples)``
         """
@@ -997,18 +1092,11 @@ class PopulationPredictiveModel(PredictiveModel):
             raise ValueError(
                 'The length of parameters does not match n_parameters.')
         if (self._population_model.n_covariates() > 0):
-            covariates = np.asarray(covariates)
-            if covariates.ndim == 1:
-                covariates = covariates[np.newaxis, :]
-            n_s, n_c = covariates.shape
-            if n_c != self._population_model.n_covariates():
+            covariates = _broadcast_covariates(covariates, n_samples)
+            if covariates.shape[1] != self._population_model.n_covariates():
                 raise ValueError(
                     'Provided covariates do not match the number of '
                     'covariates.')
-            if (n_s > 1) and (n_s != n_samples):
-                raise ValueError(
-                    'Provided covariates cannot be broadcasted to number of '
-                    'samples.')
 
         if seed is not None:
             seed = np.random.default_rng(seed)
@@ -1023,14 +1111,23 @@ class PopulationPredictiveModel(PredictiveModel):
         # Create numpy container for samples (measurements of virtual patients)
         n_outputs = self._predictive_model.get_n_outputs()
         n_times = len(times)
-        measurements = np.empty(shape=(n_outputs, n_times, n_samples))
+        if out is None:
+            # Store measurements patient by patient contiguously in memory,
+            # and expose them as a view of shape (n_outputs, n_times,
+            # n_samples)
+            measurements = np.moveaxis(
+                np.empty(shape=(n_samples, n_outputs, n_times)), 0, -1)
+        else:
+            measurements = _get_container(
+                out, shape=(n_outputs, n_times, n_samples))
 
         # Sample measurements for each patient
-        times = np.sort(times)
+        # (Samples are written directly into the container)
+        times = _ensure_sorted(times)
         for patient_id, patient in enumerate(patients):
-            measurements[..., patient_id] = self._predictive_model.sample(
-                parameters=patient, times=times, seed=seed, return_df=False
-                )[..., 0]
+            self._predictive_model.sample(
+                parameters=patient, times=times, seed=seed, return_df=False,
+                out=measurements[..., patient_id:patient_id+1])
 
         if return_df is False:
             # Return samples in numpy array format
@@ -1162,10 +1259,11 @@ class PriorPredictiveModel(AveragedPredictiveModel):
 
     def sample(
             self, times, n_samples=None, seed=None, include_regimen=False,
-            covariates=None):
+            covariates=None, return_df=True):
         """
         Samples "measurements" of the biomarkers from the prior predictive
-        model and returns them in form of a :class:`pandas.DataFrame`.
+        model and returns them in form of a :class:`pandas.DataFrame` or a
+        :class:`numpy.ndarray`.
 
         For each of the ``n_samples`` a parameter set is drawn from the
         log-prior. These paramaters are then used to sample from the predictive
@@ -1187,63 +1285,78 @@ class PriorPredictiveModel(AveragedPredictiveModel):
             subpopulation.
         :type covariates: List, np.ndarray of shape ``(n_cov,)`` or
             ``(n_samples, n_cov)``, optional
-        :rtype: :class:`pandas.DataFrame`
+        :param return_df: A boolean flag which determines whether the output is
+            returned as a :class:`pandas.DataFrame` or a
+            :class:`numpy.ndarray`.
+        :type return_df: bool, optional
+        :rtype: :class:`pandas.DataFrame` or np.ndarray of shape
+            ``(n_outputs, n_times, n_samples)``
         """
         # Make sure n_samples is an integer
         if n_samples is None:
             n_samples = 1
         n_samples = int(n_samples)
+        covariates = _broadcast_covariates(covariates, n_samples)
 
-        # Set seed for prior samples
-        # (does not affect predictive model)
-        if seed is not None:
-            # TODO: pints.Priors are not meant to be seeded, so fails when
-            # anything else but np.random is used.
-            np.random.seed(seed)
-
-            # Set predictive model base seed
-            base_seed = seed
+        # Instantiate random number generator
+        rng = np.random.default_rng(seed=seed)
 
         # Sort times
-        times = np.sort(times)
-
-        # Create container for samples
-        container = pd.DataFrame(
-            columns=['ID', 'Time', 'Observable', 'Value'])
+        times = _ensure_sorted(times)
 
-        # Get model outputs
+        # Create numpy container for samples
         outputs = self._predictive_model.get_output_names()
+        n_outputs = len(outputs)
+        n_times = len(times)
+        samples = np.empty(shape=(n_samples, n_outputs, n_times))
+
+        # Sample parameters from the log-prior
+        # (pints.LogPriors sample from numpy's global random state, so the
+        # global state is only seeded temporarily and restored afterwards)
+        if seed is not None:
+            global_state = np.random.get_state()
+            np.random.seed(rng.integers(2**32))
+        try:
+            parameters = np.asarray(self._log_prior.sample(n_samples))
+        except TypeError:
+            # The log-prior does not support drawing multiple samples at once
+            parameters = np.array([
+                np.asarray(self._log_prior.sample()).flatten()
+                for _ in range(n_samples)])
+        finally:
+            if seed is not None:
+                np.random.set_state(global_state)
 
         # Draw samples
         sample_ids = np.arange(start=1, stop=n_samples+1)
         for sample_id in sample_ids:
-            # Sample parameter
-            parameters = self._log_prior.sample().flatten()
+            # Sample one measurement from predictive model
+            # (Samples are written directly into the container)
+            self._predictive_model.sample(
+                parameters[sample_id - 1], times, n_samples=1, seed=rng,
+                return_df=False,
+                covariates=_get_row(covariates, sample_id - 1),
+                out=samples[sample_id - 1, ..., np.newaxis])
 
-            if seed is not None:
-                # Set seed for predictive model to base_seed + sample_id
-                # (Needs to change every iteration)
-                seed = base_seed + sample_id
-
-            # Sample from predictive model
-            sample = self._predictive_model.sample(
-                parameters, times, n_samples, seed, return_df=False,
-                covariates=covariates)
-
-            # Append samples to dataframe
-            for output_id, name in enumerate(outputs):
-                container = pd.concat([container, pd.DataFrame({
-                    'ID': sample_id,
-                    'Time': times,
-                    'Observable': name,
-                    'Value': sample[output_id, :, 0]})])
+        if return_df is False:
+            # Return samples in numpy array format
+            return np.moveaxis(samples, 0, -1)
+
+        # Structure samples in a pandas.DataFrame
+        # (Exploit how .flatten() arranges samples)
+        container = pd.DataFrame({
+            'ID': np.repeat(sample_ids, n_outputs * n_times),
+            'Time': np.tile(times, n_samples * n_outputs),
+            'Observable': np.tile(np.repeat(outputs, n_times), n_samples),
+            'Value': samples.flatten()})
 
         # Add dosing regimen, if set
-        final_time = np.max(times)
-        regimen = self.get_dosing_regimen(final_time)
-        if (regimen is not None) and (include_regimen is True):
-            # Append dosing regimen only once for all samples
-            container = pd.concat([container, regimen])
+        if include_regimen:
+            final_time = np.max(times)
+            regimen = self.get_dosing_regimen(final_time)
+            if regimen is not None:
+                # Append dosing regimen only once for all samples
+                container = pd.concat([container, regimen])
 
         return container
 
@@ -1324,10 +1437,11 @@ class PAMPredictiveModel(AveragedPredictiveModel):
 
     def sample(
             self, times, n_samples=None, individual=None, seed=None,
-            include_regimen=False):
+            include_regimen=False, return_df=True):
         """
         Samples "measurements" of the biomarkers from the posterior predictive
-        model and returns them in form of a :class:`pandas.DataFrame`.
+        model and returns them in form of a :class:`pandas.DataFrame` or a
+        :class:`numpy.ndarray`.
 
         For each of the ``n_samples`` a parameter set is drawn from the
         approximate posterior distribution. These paramaters are then used to
@@ -1345,8 +1459,15 @@ class PAMPredictiveModel(AveragedPredictiveModel):
         :param seed: A seed for the pseudo-random number generator.
         :type seed: int
         :param include_regimen: A boolean flag which determines whether the
-            information about the dosing regimen is included.
+            information about the dosing regimen is included. Only possible
+            when ``return_df=True``.
         :type include_regimen: bool, optional
+        :param return_df: A boolean flag which determines whether the output is
+            returned as a :class:`pandas.DataFrame` or a
+            :class:`numpy.ndarray`.
+        :type return_df: bool, optional
+        :rtype: :class:`pandas.DataFrame` or np.ndarray of shape
+            ``(n_outputs, n_times, n_samples)``
         """
         # Make sure n_samples is an integer
         if n_samples is None:
@@ -1363,7 +1484,7 @@ class PAMPredictiveModel(AveragedPredictiveModel):
             model_indices, p=self._weights, size=n_samples)
         samples_per_model = np.zeros(n_models, dtype=int)
         for model_id, model in enumerate(model_indices):
-            samples_per_model[model_id] = np.sum(
+            samples_per_model[model_id] = np.count_nonzero(
                 model_draws == model)
 
         # Sample from predictive models
@@ -1375,23 +1496,30 @@ class PAMPredictiveModel(AveragedPredictiveModel):
 
             # Sample
             model = self._predictive_models[model_id]
-            s = model.sample(times, n_samples, individual, seed=seed)
+            s = model.sample(
+                times, n_samples, individual, seed=seed, return_df=return_df)
 
             # Shift IDs by number of previous draws
-            s['ID'] += int(np.sum(samples_per_model[:model_id]))
+            if return_df:
+                s['ID'] += int(np.sum(samples_per_model[:model_id]))
 
             # Append samples to list
             samples.append(s)
 
+        if return_df is False:
+            # Concatenate samples along the sample axis
+            return np.concatenate(samples, axis=-1)
+
         # Concatenate all samples to one dataframe
         samples = pd.concat(samples)
 
         # Add dosing regimen, if set
-        final_time = np.max(times)
-        regimen = self.get_dosing_regimen(final_time)
-        if (regimen is not None) and (include_regimen is True):
-            # Append dosing regimen only once for all samples
-            samples = pd.concat([samples, regimen])
+        if include_regimen:
+            final_time = np.max(times)
+            regimen = self.get_dosing_regimen(final_time)
+            if regimen is not None:
+                # Append dosing regimen only once for all samples
+                samples = pd.concat([samples, regimen])
 
         return samples
 
@@ -5,8 +5,7 @@
 # full license details.
 #
 
-import copy
-
+import numpy as np
 import pandas as pd
 import plotly.colors
 import plotly.graph_objects as go
@@ -33,67 +32,40 @@ class ParameterEstimatePlot(plots.MultiFigure):
     def __init__(self):
         super(ParameterEstimatePlot, self).__init__()
 
-    def _add_box_plots(self, fig_id, data, colors):
+    def _create_trace(self, individual, estimates, scores, runs, color):
         """
-        Adds box plots of the parameter estimates for each individual across
-        runs to the figure.
+        Returns a box plot of an individuals estimates across multiple
+        optimisation runs.
 
-        One figure only contains the estimates of one parameter.
-        """
-        # Get number of colours in scheme
-        n_colors = len(colors)
-
-        # Add trace for each individual
-        ids = data[self._id_key].unique()
-        for index, individual in enumerate(ids):
-            # Mask for individuals/populations parameter
-            mask = data[self._id_key] == individual
-            if individual is None:
-                mask = data[self._id_key].isna()
-
-            # Get data for indvidual or population parameter
-            estimates = data[self._est_key][mask]
-            scores = data[self._score_key][mask].to_numpy()
-            runs = data[self._run_key][mask].to_numpy()
-            color = colors[index % n_colors]
-
-            self._add_trace(
-                fig_id, individual, estimates, scores, runs, color)
-
-    def _add_trace(
-            self, fig_id, individual, estimates, scores, runs, color):
-        """
-        Adds a box plot of an individuals estimates across multiple
-        optimisation runs to a figure.
+        The trace is returned as a dictionary, so it is only validated once it
+        is added to a figure.
         """
-        # Get number of runs
-        n_runs = len(runs)
+        # Format hover text of the estimates
+        text = np.char.add(
+            np.char.mod('Run: %d <br>Log-posterior score: ', runs),
+            np.char.mod('%.2f', scores))
 
         # Population parameters have an ID of None
-        _id = 'Population' if individual is None else individual
-
-        # Add trace
-        fig = self._figs[fig_id]
-        fig.add_trace(
-            go.Box(
-                y=estimates,
-                name='%s' % str(_id),
-                hovertemplate=(
-                    'Estimate: %{y:.2f}<br>'
-                    '%{text}'),
-                text=[
-                    'Run: %d <br>Log-posterior score: %.2f' % (
-                        runs[i], scores[i]) for i in range(n_runs)],
-                boxpoints='all',
-                jitter=0.2,
-                pointpos=-1.5,
-                visible=True,
-                marker=dict(
-                    symbol='circle',
-                    opacity=0.7,
-                    line=dict(color='black', width=1)),
-                marker_color=color,
-                line_color=color))
+        name = 'Population' if individual is None else str(individual)
+
+        return dict(
+            type='box',
+            y=estimates,
+            name=name,
+            hovertemplate=(
+                'Estimate: %{y:.2f}<br>'
+                '%{text}'),
+            text=text,
+            boxpoints='all',
+            jitter=0.2,
+            pointpos=-1.5,
+            visible=True,
+            marker=dict(
+                symbol='circle',
+                opacity=0.7,
+                line=dict(color='black', width=1)),
+            marker_color=color,
+            line_color=color)
 
     def add_data(
             self, data, id_key='ID', param_key='Parameter', est_key='Estimate',
@@ -130,29 +102,60 @@ class ParameterEstimatePlot(plots.MultiFigure):
             raise TypeError(
                 'Data has to be pandas.DataFrame.')
 
-        keys = [param_key, id_key, est_key, score_key, run_key]
-        for key in keys:
-            if key not in data.keys():
+        columns = set(data.columns)
+        for key in [param_key, id_key, est_key, score_key, run_key]:
+            if key not in columns:
                 raise ValueError(
                     'Data does not have the key <' + str(key) + '>.')
-        self._id_key, self._est_key, self._score_key, self._run_key = keys[1:]
 
-        # Get a colour scheme
-        colors = plotly.colors.qualitative.Plotly
+        # Encode parameters and IDs as integer codes once, so the estimates
+        # can be grouped without hashing the labels again
+        # (Population parameters have a missing ID, which is factorised to -1)
+        param_codes, parameters = pd.factorize(data[param_key])
+        id_codes, ids = pd.factorize(data[id_key])
 
         # Create one figure for each parameter
-        parameters = data[param_key].unique()
-        self._figs = [copy.copy(self._fig) for _ in parameters]
-
-        # Add estimates to parameter figures
+        # (Serialise the template figure only once)
+        template = self._fig.to_dict()
+        self._figs = [go.Figure(template) for _ in parameters]
         for index, parameter in enumerate(parameters):
             # Set y label of plot to parameter name
             self._figs[index].update_layout(
                 yaxis_title=parameter)
 
-            # Get estimates for this parameter
-            mask = data[param_key] == parameter
-            estimates = data[mask][[id_key, est_key, score_key, run_key]]
-
-            # Add box plots for all individuals
-            self._add_box_plots(index, estimates, colors)
+        # Assign each individual the same colour across all figures
+        # (Population parameters get the first colour of the scheme)
+        colors = plotly.colors.qualitative.Plotly
+        n_colors = len(colors)
+        color_map = {
+            id_code: colors[max(id_code, 0) % n_colors]
+            for id_code in range(-1, len(ids))}
+
+        # Group estimates by parameter and individual
+        # (Groups are added in order of their first appearance)
+        groups = data.groupby([param_codes, id_codes]).indices
+        groups = sorted(groups.items(), key=lambda group: group[1][0])
+
+        # Create box plots of each individual's estimates
+        # (Columns are converted to numpy arrays once, and the estimates of
+        # each group are selected by their row positions)
+        estimates = data[est_key].to_numpy()
+        scores = data[score_key].to_numpy()
+        runs = data[run_key].to_numpy()
+        traces = [[] for _ in parameters]
+        for (fig_id, id_code), rows in groups:
+            if fig_id == -1:
+                # Estimates without a parameter name cannot be assigned to a
+                # figure
+                continue
+
+            individual = None if id_code == -1 else ids[id_code]
+            traces[fig_id].append(self._create_trace(
+                individual, estimates[rows], scores[rows], runs[rows],
+                color_map[id_code]))
+
+        # Add box plots to the parameter figures
+        # (Adding all traces of a figure at once avoids revalidating the
+        # figure's data for each trace)
+        for fig, fig_traces in zip(self._figs, traces):
+            fig.add_traces(fig_traces)
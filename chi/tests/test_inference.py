@@ -6,6 +6,7 @@
 #
 
 import copy
+import functools
 import unittest
 
 import arviz as az
@@ -17,6 +18,18 @@ import chi
 from chi.library import DataLibrary, ModelLibrary
 
 
+@functools.lru_cache(maxsize=None)
+def tumour_growth_inhibition_model():
+    """
+    Returns the tumour growth inhibition model shared by the test cases.
+
+    Loading the model compiles a simulator, so the model is loaded only once.
+    Log-likelihoods and problem controllers copy the model, so the shared
+    instance is never modified.
+    """
+    return ModelLibrary().tumour_growth_inhibition_model_koch()
+
+
 class TestComputePointwiseLogLikelihood(unittest.TestCase):
     """
     Tests the chi.compute_pointwise_loglikelihood function.
@@ -34,8 +47,7 @@ class TestComputePointwiseLogLikelihood(unittest.TestCase):
         times = data[mask]['Time'].to_numpy()
         observed_volumes = data[mask]['Value'].to_numpy()
 
-        mechanistic_model = \
-            ModelLibrary().tumour_growth_inhibition_model_koch()
+        mechanistic_model = tumour_growth_inhibition_model()
         error_model = chi.ConstantAndMultiplicativeGaussianErrorModel()
         cls.log_likelihood = chi.LogLikelihood(
             mechanistic_model, error_model, observed_volumes, times)
@@ -583,8 +595,7 @@ class TestInferenceController(unittest.TestCase):
         times = data[mask]['Time'].to_numpy()
         observed_volumes = data[mask]['Value'].to_numpy()
 
-        mechanistic_model = \
-            ModelLibrary().tumour_growth_inhibition_model_koch()
+        mechanistic_model = tumour_growth_inhibition_model()
         error_model = chi.ConstantAndMultiplicativeGaussianErrorModel()
         cls.log_likelihood = chi.LogLikelihood(
             mechanistic_model, error_model, observed_volumes, times)
@@ -677,7 +688,7 @@ class TestOptimisationController(unittest.TestCase):
     def setUpClass(cls):
         # Set up test problems
         # Model I: Individual with ID 40
-        model = ModelLibrary().tumour_growth_inhibition_model_koch()
+        model = tumour_growth_inhibition_model()
         error_models = [chi.ConstantAndMultiplicativeGaussianErrorModel()]
         cls.problem = chi.ProblemModellingController(model, error_models)
 
@@ -691,6 +702,16 @@ class TestOptimisationController(unittest.TestCase):
         cls.log_posterior_id_40 = cls.problem.get_log_posterior(
             individual='40')
 
+        # Create one optimisation controller for individual 40, which is
+        # shared by the tests
+        # (Set evaluator to sequential, because otherwise codecov
+        # complains that posterior was never evaluated. Potentially codecov
+        # cannot keep track of multiple CPUs)
+        cls.optimiser_id_40 = chi.OptimisationController(
+            cls.log_posterior_id_40)
+        cls.optimiser_id_40.set_parallel_evaluation(False)
+        cls.optimiser_id_40.set_n_runs(3)
+
         # Model II: Hierarchical model across all individuals
         pop_model = chi.ComposedPopulationModel([
             chi.PooledModel(),
@@ -714,15 +735,7 @@ class TestOptimisationController(unittest.TestCase):
 
     def test_run(self):
         # Case I: Individual with ID 40
-        optimiser = chi.OptimisationController(self.log_posterior_id_40)
-
-        # Set evaluator to sequential, because otherwise codecov
-        # complains that posterior was never evaluated.
-        # (Potentially codecov cannot keep track of multiple CPUs)
-        optimiser.set_parallel_evaluation(False)
-
-        optimiser.set_n_runs(3)
-        result = optimiser.run(n_max_iterations=20)
+        result = self.optimiser_id_40.run(n_max_iterations=20)
 
         keys = result.keys()
         self.assertEqual(len(keys), 5)
@@ -851,7 +864,9 @@ class TestOptimisationController(unittest.TestCase):
         self.assertEqual(runs[2], 3)
 
     def test_set_optmiser(self):
-        optimiser = chi.OptimisationController(self.log_posterior_id_40)
+        # Test ends with the default optimiser, so the shared controller is
+        # left unchanged
+        optimiser = self.optimiser_id_40
         optimiser.set_optimiser(pints.PSO)
         self.assertEqual(optimiser._optimiser, pints.PSO)
 
@@ -859,9 +874,8 @@ class TestOptimisationController(unittest.TestCase):
         self.assertEqual(optimiser._optimiser, pints.CMAES)
 
     def test_set_optimiser_bad_input(self):
-        optimiser = chi.OptimisationController(self.log_posterior_id_40)
         with self.assertRaisesRegex(ValueError, 'Optimiser has to be'):
-            optimiser.set_optimiser(str)
+            self.optimiser_id_40.set_optimiser(str)
 
 
 class TestSamplingController(unittest.TestCase):
@@ -873,7 +887,7 @@ class TestSamplingController(unittest.TestCase):
     def setUpClass(cls):
         # Set up test problems
         # Model I: Individual with ID 40
-        model = ModelLibrary().tumour_growth_inhibition_model_koch()
+        model = tumour_growth_inhibition_model()
         error_models = [chi.ConstantAndMultiplicativeGaussianErrorModel()]
         problem = chi.ProblemModellingController(model, error_models)
 
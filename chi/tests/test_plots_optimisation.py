@@ -55,6 +55,40 @@ class TestParameterEstimatePlot(unittest.TestCase):
         # Create test figure
         cls.fig = plots.ParameterEstimatePlot()
 
+    def test_add_data(self):
+        self.fig.add_data(self.data)
+
+        # One figure per parameter, one box plot per individual
+        figs = self.fig._figs
+        self.assertEqual(len(figs), 3)
+        self.assertEqual([t.name for t in figs[0].data], ['0', '1', '2'])
+        self.assertEqual([t.name for t in figs[1].data], ['0', '1', '2'])
+        self.assertEqual([t.name for t in figs[2].data], ['Population'])
+        self.assertEqual(len(figs[0].data[0].y), 2)
+        self.assertEqual(len(figs[2].data[0].y), 8)
+        self.assertEqual(
+            figs[0].data[0].text[0], 'Run: 1 <br>Log-posterior score: 10.00')
+
+    def test_add_data_colors(self):
+        # Individuals are listed in a different order for each parameter
+        data = pd.DataFrame({
+            'ID': [0, 1, 1, 0],
+            'Parameter': ['Param 1', 'Param 1', 'Param 2', 'Param 2'],
+            'Estimate': [1, 2, 3, 4],
+            'Score': [10, 10, 10, 10],
+            'Run': [1, 1, 1, 1]})
+        self.fig.add_data(data)
+
+        # Check that each individual has the same colour in all figures
+        figs = self.fig._figs
+        self.assertEqual([t.name for t in figs[1].data], ['1', '0'])
+        self.assertEqual(
+            figs[0].data[0].marker.color, figs[1].data[1].marker.color)
+        self.assertEqual(
+            figs[0].data[1].marker.color, figs[1].data[0].marker.color)
+        self.assertNotEqual(
+            figs[0].data[0].marker.color, figs[0].data[1].marker.color)
+
     def test_wrong_data_type(self):
         # Create data of wrong type
         data = np.ones(shape=(10, 4))
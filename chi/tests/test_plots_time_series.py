@@ -5,381 +5,295 @@
 # full license details.
 #
 
+import functools
 import unittest
 
 import numpy as np
-import plotly.graph_objects as go
 
 from chi import plots
 from chi.library import DataLibrary
 
 
-class TestPDPredictivePlot(unittest.TestCase):
+@functools.lru_cache(maxsize=None)
+def lung_cancer_control_group():
     """
-    Tests the chi.plots.PDPredictivePlot class.
-    """
-
-    @classmethod
-    def setUpClass(cls):
-        # Create test datasets
-        cls.data = DataLibrary().lung_cancer_control_group()
-        cls.prediction = cls.data.copy()
-
-        # Create test figure
-        cls.fig = plots.PDPredictivePlot()
-
-    def test_add_data_wrong_data_type(self):
-        # Create data of wrong type
-        data = np.ones(shape=(10, 4))
-
-        with self.assertRaisesRegex(TypeError, 'Data has to be'):
-            self.fig.add_data(data)
-
-    def test_add_data_wrong_observable(self):
-        biomarker = 'Does not exist'
-
-        with self.assertRaisesRegex(ValueError, 'The observable could not be'):
-            self.fig.add_data(self.data, biomarker)
+    Returns the lung cancer control group dataset shared by the test cases.
 
-    def test_add_data_wrong_id_key(self):
-        # Rename ID key
-        data = self.data.rename(columns={'ID': 'SOME NON-STANDARD KEY'})
-
-        self.assertRaisesRegex(
-            ValueError, 'Data does not have the key <ID>.',
-            self.fig.add_data, data)
-
-    def test_add_data_wrong_time_key(self):
-        # Rename time key
-        data = self.data.rename(columns={'Time': 'SOME NON-STANDARD KEY'})
-
-        self.assertRaisesRegex(
-            ValueError, 'Data does not have the key <Time>.',
-            self.fig.add_data, data)
-
-    def test_add_data_wrong_obs_key(self):
-        # Rename biomarker key
-        data = self.data.rename(
-            columns={'Observable': 'SOME NON-STANDARD KEY'})
-
-        self.assertRaisesRegex(
-            ValueError, 'Data does not have the key <Observable>.',
-            self.fig.add_data, data)
+    The plots never modify the data in place, so the dataset is read only
+    once.
+    """
+    return DataLibrary().lung_cancer_control_group()
 
-    def test_add_data_wrong_value_key(self):
-        # Rename Value key
-        data = self.data.rename(
-            columns={'Value': 'SOME NON-STANDARD KEY'})
 
-        self.assertRaisesRegex(
-            ValueError, 'Data does not have the key <Value>.',
-            self.fig.add_data, data)
+@functools.lru_cache(maxsize=None)
+def lung_cancer_low_erlotinib_dose_group():
+    """
+    Returns the lung cancer low erlotinib dose group dataset shared by the
+    test cases.
 
-    def test_add_data_id_key_mapping(self):
-        # Rename ID key
-        data = self.data.rename(columns={'ID': 'SOME NON-STANDARD KEY'})
+    The plots never modify the data in place, so the dataset is read only
+    once.
+    """
+    return DataLibrary().lung_cancer_low_erlotinib_dose_group()
 
-        # Test that it works with correct mapping
-        self.fig.add_data(
-            data, id_key='SOME NON-STANDARD KEY')
 
-        # Test that it fails with wrong mapping
-        with self.assertRaisesRegex(
-                ValueError, 'Data does not have the key <SOME WRONG KEY>.'):
-            self.fig.add_data(data, id_key='SOME WRONG KEY')
+@functools.lru_cache(maxsize=None)
+def control_group_prediction():
+    """
+    Returns the lung cancer control group dataset with the observables
+    stored as categories, for use as a prediction.
 
-    def test_add_data_time_key_mapping(self):
-        # Rename time key
-        data = self.data.rename(columns={'Time': 'SOME NON-STANDARD KEY'})
+    The observable masks of the plots then compare integer codes instead of
+    strings.
+    """
+    return lung_cancer_control_group().astype({'Observable': 'category'})
 
-        # Test that it works with correct mapping
-        self.fig.add_data(
-            data, time_key='SOME NON-STANDARD KEY')
 
-        # Test that it fails with wrong mapping
-        with self.assertRaisesRegex(
-                ValueError, 'Data does not have the key <SOME WRONG KEY>.'):
-            self.fig.add_data(
-                data, time_key='SOME WRONG KEY')
+@functools.lru_cache(maxsize=None)
+def low_erlotinib_dose_group_prediction():
+    """
+    Returns the lung cancer low erlotinib dose group dataset with the
+    observables stored as categories, for use as a prediction.
 
-    def test_add_data_obs_key_mapping(self):
-        # Rename biomarker key
-        data = self.data.rename(
-            columns={'Observable': 'SOME NON-STANDARD KEY'})
+    The observable masks of the plots then compare integer codes instead of
+    strings.
+    """
+    return lung_cancer_low_erlotinib_dose_group().astype(
+        {'Observable': 'category'})
 
-        # Test that it works with correct mapping
-        self.fig.add_data(
-            data, obs_key='SOME NON-STANDARD KEY')
 
-        # Test that it fails with wrong mapping
-        with self.assertRaisesRegex(
-                ValueError, 'Data does not have the key <SOME WRONG KEY>.'):
-            self.fig.add_data(
-                data, obs_key='SOME WRONG KEY')
+@functools.lru_cache(maxsize=None)
+def renamed_dataset(dataset, key):
+    """
+    Returns the dataset with the column ``key`` renamed to
+    ``'SOME NON-STANDARD KEY'``.
 
-    def test_add_data_value_key_mapping(self):
-        # Rename Value key
-        data = self.data.rename(
-            columns={'Value': 'SOME NON-STANDARD KEY'})
+    ``dataset`` is one of the cached dataset functions above, so test cases
+    that use the same dataset share the renamed copies.
+    """
+    return dataset().rename(columns={key: 'SOME NON-STANDARD KEY'})
 
-        # Test that it works with correct mapping
-        self.fig.add_data(
-            data, value_key='SOME NON-STANDARD KEY')
 
-        # Test that it fails with wrong mapping
-        with self.assertRaisesRegex(
-                ValueError, 'Data does not have the key <SOME WRONG KEY>.'):
-            self.fig.add_data(
-                data, value_key='SOME WRONG KEY')
+# Column keys of the datasets and the key arguments of the add methods
+DATA_KEYS = {
+    'ID': 'id_key',
+    'Time': 'time_key',
+    'Observable': 'obs_key',
+    'Value': 'value_key'}
+PK_DATA_KEYS = dict(DATA_KEYS, Dose='dose_key')
+PREDICTION_KEYS = {
+    'Time': 'time_key',
+    'Observable': 'obs_key',
+    'Value': 'value_key'}
+SIMULATION_KEYS = {
+    'Time': 'time_key',
+    'Value': 'value_key'}
 
-    def test_add_prediction_wrong_data_type(self):
-        # Create data of wrong type
-        data = np.ones(shape=(10, 4))
 
-        self.assertRaisesRegex(
-            TypeError, 'Data has to be pandas.DataFrame.',
-            self.fig.add_prediction, data)
+def _wrong_key_test(method, renamed, key):
+    def test(self):
+        # Get data with renamed key
+        data = getattr(self, renamed)[key]
 
-    def test_add_prediction_wrong_observable(self):
-        # Specify biomarker that is not in the dataset
-        biomarker = 'Does not exist'
+        self._check_wrong_key(getattr(self.fig, method), data, key)
 
-        with self.assertRaisesRegex(ValueError, 'The observable could not be'):
-            self.fig.add_prediction(self.prediction, biomarker)
+    return test
 
-    def test_add_prediction_bad_bulk_probs(self):
-        # A maximum of 7 bulk probs are allowed
-        bulk_probs = [0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9]
 
-        with self.assertRaisesRegex(ValueError, 'At most 7 different bulk'):
-            self.fig.add_prediction(self.prediction, bulk_probs=bulk_probs)
+def _key_mapping_test(method, renamed, key, kwarg):
+    def test(self):
+        # Get data with renamed key
+        data = getattr(self, renamed)[key]
 
-        # Negative probability
-        bulk_probs = [-0.1]
+        self._check_key_mapping(getattr(self.fig, method), data, kwarg)
 
-        with self.assertRaisesRegex(ValueError, 'The provided bulk prob'):
-            self.fig.add_prediction(self.prediction, bulk_probs=bulk_probs)
+    return test
 
-        # Probability greater 1
-        bulk_probs = [1.1]
 
-        with self.assertRaisesRegex(ValueError, 'The provided bulk prob'):
-            self.fig.add_prediction(self.prediction, bulk_probs=bulk_probs)
+def key_tests(method, keys, renamed='data_renamed'):
+    """
+    Returns a class decorator that adds a wrong key and a key mapping test
+    of the figure's add ``method`` for each of the ``keys``.
 
-    def test_add_prediction_wrong_time_key(self):
-        # Rename time key
-        data = self.prediction.rename(
-            columns={'Time': 'SOME NON-STANDARD KEY'})
+    ``keys`` maps the column keys to the key arguments of the method, and
+    ``renamed`` names the class attribute that holds the data with the
+    renamed keys.
+    """
+    def add_tests(cls):
+        for key, kwarg in keys.items():
+            name = kwarg[:-len('_key')]
+            setattr(
+                cls, 'test_%s_wrong_%s_key' % (method, name),
+                _wrong_key_test(method, renamed, key))
+            setattr(
+                cls, 'test_%s_%s_key_mapping' % (method, name),
+                _key_mapping_test(method, renamed, key, kwarg))
 
-        self.assertRaisesRegex(
-            ValueError, 'Data does not have the key <Time>.',
-            self.fig.add_prediction, data)
+        return cls
 
-    def test_add_prediction_wrong_obs_key(self):
-        # Rename biomarker key
-        data = self.prediction.rename(
-            columns={'Observable': 'SOME NON-STANDARD KEY'})
+    return add_tests
 
-        self.assertRaisesRegex(
-            ValueError, 'Data does not have the key <Observable>.',
-            self.fig.add_prediction, data)
 
-    def test_add_prediction_wrong_value_key(self):
-        # Rename value key
-        data = self.prediction.rename(
-            columns={'Value': 'SOME NON-STANDARD KEY'})
+class KeyValidationMixin(object):
+    """
+    Shared checks of the input validation of the time series plots' add
+    methods.
 
-        self.assertRaisesRegex(
-            ValueError, 'Data does not have the key <Value>.',
-            self.fig.add_prediction, data)
+    The test cases share one figure, whose traces are removed after each
+    test.
+    """
 
-    def test_add_prediction_obs_mapping(self):
-        # Rename rename biomarker
-        data = self.prediction.copy()
-        data['Observable'] = 'SOME NON-STANDARD BIOMARKER'
+    def tearDown(self):
+        # Remove the traces of the test, so they do not accumulate across
+        # tests
+        self.fig._fig.data = []
 
-        # Test that it works with correct mapping
-        self.fig.add_prediction(
-            data=data, observable='SOME NON-STANDARD BIOMARKER')
+    def _check_wrong_data_type(self, add):
+        # Create data of wrong type (the type is checked before the content)
+        data = np.empty(shape=(1, 1))
 
-        # Test that it fails with wrong mapping
         with self.assertRaisesRegex(
-                ValueError, 'The observable could not be found'):
-            self.fig.add_prediction(
-                data=data, observable='SOME WRONG BIOMARKER')
-
-    def test_add_prediction_no_provided_bulk_prob(self):
-        # Test that it works with correct mapping
-        self.fig.add_prediction(data=self.prediction, bulk_probs=None)
-
-        trace = self.fig._fig.data[-1]
-        self.assertIsInstance(trace, go.Scatter)
+                TypeError, 'Data has to be pandas.DataFrame.'):
+            add(data)
 
-    def test_add_prediction_time_key_mapping(self):
-        # Rename time key
-        data = self.prediction.rename(
-            columns={'Time': 'SOME NON-STANDARD KEY'})
+    def _check_wrong_key(self, add, data, key):
+        with self.assertRaisesRegex(
+                ValueError, 'Data does not have the key <%s>.' % key):
+            add(data)
 
+    def _check_key_mapping(self, add, data, kwarg):
         # Test that it works with correct mapping
-        self.fig.add_prediction(data=data, time_key='SOME NON-STANDARD KEY')
+        add(data=data, **{kwarg: 'SOME NON-STANDARD KEY'})
 
         # Test that it fails with wrong mapping
         with self.assertRaisesRegex(
                 ValueError, 'Data does not have the key <SOME WRONG KEY>.'):
-            self.fig.add_prediction(data=data, time_key='SOME WRONG KEY')
+            add(data=data, **{kwarg: 'SOME WRONG KEY'})
 
-    def test_add_prediction_obs_key_mapping(self):
-        # Rename biomarker key
-        data = self.prediction.rename(
-            columns={'Observable': 'SOME NON-STANDARD KEY'})
 
-        # Test that it works with correct mapping
-        self.fig.add_prediction(data=data, obs_key='SOME NON-STANDARD KEY')
-
-        # Test that it fails with wrong mapping
-        with self.assertRaisesRegex(
-                ValueError, 'Data does not have the key <SOME WRONG KEY>.'):
-            self.fig.add_prediction(data=data, obs_key='SOME WRONG KEY')
+class PredictivePlotMixin(KeyValidationMixin):
+    """
+    Shared tests of the bulk probabilities of the predictive plots.
+    """
+    # Invalid bulk probabilities
+    too_many_bulk_probs = [0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9]
+    negative_bulk_probs = [-0.1]
+    too_large_bulk_probs = [1.1]
 
-    def test_add_prediction_value_key_mapping(self):
-        # Rename value key
-        data = self.prediction.rename(
-            columns={'Value': 'SOME NON-STANDARD KEY'})
+    def test_add_prediction_bad_bulk_probs(self):
+        # A maximum of 7 bulk probs are allowed, and probabilities have to be
+        # between 0 and 1
+        cases = [
+            (self.too_many_bulk_probs, 'At most 7 different bulk'),
+            (self.negative_bulk_probs, 'The provided bulk prob'),
+            (self.too_large_bulk_probs, 'The provided bulk prob')]
+        for bulk_probs, message in cases:
+            with self.subTest(bulk_probs=bulk_probs):
+                with self.assertRaisesRegex(ValueError, message):
+                    self.fig.add_prediction(
+                        self.prediction, bulk_probs=bulk_probs)
 
+    def test_add_prediction_no_provided_bulk_prob(self):
         # Test that it works with correct mapping
-        self.fig.add_prediction(data=data, value_key='SOME NON-STANDARD KEY')
+        self.fig.add_prediction(data=self.prediction, bulk_probs=None)
 
-        # Test that it fails with wrong mapping
-        with self.assertRaisesRegex(
-                ValueError, 'Data does not have the key <SOME WRONG KEY>.'):
-            self.fig.add_prediction(data=data, value_key='SOME WRONG KEY')
+        trace = self.fig._fig.data[-1]
+        self.assertEqual(trace.type, 'scatter')
 
 
-class TestPKPredictivePlot(unittest.TestCase):
+@key_tests('add_data', DATA_KEYS)
+@key_tests('add_prediction', PREDICTION_KEYS, renamed='prediction_renamed')
+class TestPDPredictivePlot(PredictivePlotMixin, unittest.TestCase):
     """
-    Tests the chi.plots.PKPredictivePlot class.
+    Tests the chi.plots.PDPredictivePlot class.
     """
 
     @classmethod
     def setUpClass(cls):
         # Create test datasets
-        cls.data = DataLibrary().lung_cancer_low_erlotinib_dose_group()
-        cls.prediction = cls.data.copy()
+        cls.data = lung_cancer_control_group()
+        cls.prediction = control_group_prediction()
+
+        # Rename each key of the datasets once
+        cls.data_renamed = {
+            key: renamed_dataset(lung_cancer_control_group, key)
+            for key in DATA_KEYS}
+        cls.prediction_renamed = {
+            key: renamed_dataset(control_group_prediction, key)
+            for key in PREDICTION_KEYS}
 
         # Create test figure
-        cls.fig = plots.PKPredictivePlot()
+        cls.fig = plots.PDPredictivePlot()
 
     def test_add_data_wrong_data_type(self):
-        # Create data of wrong type
-        data = np.ones(shape=(10, 4))
-
-        with self.assertRaisesRegex(TypeError, 'Data has to be'):
-            self.fig.add_data(data)
+        self._check_wrong_data_type(self.fig.add_data)
 
     def test_add_data_wrong_observable(self):
-        observable = 'Does not exist'
+        biomarker = 'Does not exist'
 
         with self.assertRaisesRegex(ValueError, 'The observable could not be'):
-            self.fig.add_data(self.data, observable)
-
-    def test_add_data_wrong_id_key(self):
-        # Rename ID key
-        data = self.data.rename(columns={'ID': 'SOME NON-STANDARD KEY'})
-
-        self.assertRaisesRegex(
-            ValueError, 'Data does not have the key <ID>.',
-            self.fig.add_data, data)
-
-    def test_add_data_wrong_time_key(self):
-        # Rename time key
-        data = self.data.rename(columns={'Time': 'SOME NON-STANDARD KEY'})
-
-        self.assertRaisesRegex(
-            ValueError, 'Data does not have the key <Time>.',
-            self.fig.add_data, data)
-
-    def test_add_data_wrong_obs_key(self):
-        # Rename observable key
-        data = self.data.rename(
-            columns={'Observable': 'SOME NON-STANDARD KEY'})
+            self.fig.add_data(self.data, biomarker)
 
-        self.assertRaisesRegex(
-            ValueError, 'Data does not have the key <Observable>.',
-            self.fig.add_data, data)
+    def test_add_prediction_wrong_data_type(self):
+        self._check_wrong_data_type(self.fig.add_prediction)
 
-    def test_add_data_wrong_value_key(self):
-        # Rename Value key
-        data = self.data.rename(
-            columns={'Value': 'SOME NON-STANDARD KEY'})
+    def test_add_prediction_wrong_observable(self):
+        # Specify biomarker that is not in the dataset
+        biomarker = 'Does not exist'
 
-        self.assertRaisesRegex(
-            ValueError, 'Data does not have the key <Value>.',
-            self.fig.add_data, data)
+        with self.assertRaisesRegex(ValueError, 'The observable could not be'):
+            self.fig.add_prediction(self.prediction, biomarker)
 
-    def test_add_data_id_key_mapping(self):
-        # Rename ID key
-        data = self.data.rename(columns={'ID': 'SOME NON-STANDARD KEY'})
+    def test_add_prediction_obs_mapping(self):
+        # Rename biomarker
+        data = self.prediction.assign(Observable='SOME NON-STANDARD BIOMARKER')
 
         # Test that it works with correct mapping
-        self.fig.add_data(
-            data, id_key='SOME NON-STANDARD KEY')
+        self.fig.add_prediction(
+            data=data, observable='SOME NON-STANDARD BIOMARKER')
 
         # Test that it fails with wrong mapping
         with self.assertRaisesRegex(
-                ValueError, 'Data does not have the key <SOME WRONG KEY>.'):
-            self.fig.add_data(data, id_key='SOME WRONG KEY')
-
-    def test_add_data_time_key_mapping(self):
-        # Rename time key
-        data = self.data.rename(columns={'Time': 'SOME NON-STANDARD KEY'})
+                ValueError, 'The observable could not be found'):
+            self.fig.add_prediction(
+                data=data, observable='SOME WRONG BIOMARKER')
 
-        # Test that it works with correct mapping
-        self.fig.add_data(
-            data, time_key='SOME NON-STANDARD KEY')
 
-        # Test that it fails with wrong mapping
-        with self.assertRaisesRegex(
-                ValueError, 'Data does not have the key <SOME WRONG KEY>.'):
-            self.fig.add_data(
-                data, time_key='SOME WRONG KEY')
+@key_tests('add_data', DATA_KEYS)
+@key_tests('add_prediction', PREDICTION_KEYS, renamed='prediction_renamed')
+class TestPKPredictivePlot(PredictivePlotMixin, unittest.TestCase):
+    """
+    Tests the chi.plots.PKPredictivePlot class.
+    """
 
-    def test_add_data_obs_key_mapping(self):
-        # Rename observable key
-        data = self.data.rename(
-            columns={'Observable': 'SOME NON-STANDARD KEY'})
+    @classmethod
+    def setUpClass(cls):
+        # Create test datasets
+        cls.data = lung_cancer_low_erlotinib_dose_group()
+        cls.prediction = low_erlotinib_dose_group_prediction()
 
-        # Test that it works with correct mapping
-        self.fig.add_data(
-            data, obs_key='SOME NON-STANDARD KEY')
+        # Rename each key of the datasets once
+        cls.data_renamed = {
+            key: renamed_dataset(lung_cancer_low_erlotinib_dose_group, key)
+            for key in DATA_KEYS}
+        cls.prediction_renamed = {
+            key: renamed_dataset(low_erlotinib_dose_group_prediction, key)
+            for key in PREDICTION_KEYS}
 
-        # Test that it fails with wrong mapping
-        with self.assertRaisesRegex(
-                ValueError, 'Data does not have the key <SOME WRONG KEY>.'):
-            self.fig.add_data(
-                data, obs_key='SOME WRONG KEY')
+        # Create test figure
+        cls.fig = plots.PKPredictivePlot()
 
-    def test_add_data_value_key_mapping(self):
-        # Rename Value key
-        data = self.data.rename(
-            columns={'Value': 'SOME NON-STANDARD KEY'})
+    def test_add_data_wrong_data_type(self):
+        self._check_wrong_data_type(self.fig.add_data)
 
-        # Test that it works with correct mapping
-        self.fig.add_data(
-            data, value_key='SOME NON-STANDARD KEY')
+    def test_add_data_wrong_observable(self):
+        observable = 'Does not exist'
 
-        # Test that it fails with wrong mapping
-        with self.assertRaisesRegex(
-                ValueError, 'Data does not have the key <SOME WRONG KEY>.'):
-            self.fig.add_data(
-                data, value_key='SOME WRONG KEY')
+        with self.assertRaisesRegex(ValueError, 'The observable could not be'):
+            self.fig.add_data(self.data, observable)
 
     def test_add_prediction_wrong_data_type(self):
-        # Create data of wrong type
-        data = np.ones(shape=(10, 4))
-
-        self.assertRaisesRegex(
-            TypeError, 'Data has to be pandas.DataFrame.',
-            self.fig.add_prediction, data)
+        self._check_wrong_data_type(self.fig.add_prediction)
 
     def test_add_prediction_wrong_observable(self):
         # Specify observable that is not in the dataset
@@ -388,56 +302,10 @@ class TestPKPredictivePlot(unittest.TestCase):
         with self.assertRaisesRegex(ValueError, 'The observable could not be'):
             self.fig.add_prediction(self.prediction, observable)
 
-    def test_add_prediction_bad_bulk_probs(self):
-        # A maximum of 7 bulk probs are allowed
-        bulk_probs = [0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9]
-
-        with self.assertRaisesRegex(ValueError, 'At most 7 different bulk'):
-            self.fig.add_prediction(self.prediction, bulk_probs=bulk_probs)
-
-        # Negative probability
-        bulk_probs = [-0.1]
-
-        with self.assertRaisesRegex(ValueError, 'The provided bulk prob'):
-            self.fig.add_prediction(self.prediction, bulk_probs=bulk_probs)
-
-        # Probability greater 1
-        bulk_probs = [1.1]
-
-        with self.assertRaisesRegex(ValueError, 'The provided bulk prob'):
-            self.fig.add_prediction(self.prediction, bulk_probs=bulk_probs)
-
-    def test_add_prediction_wrong_time_key(self):
-        # Rename time key
-        data = self.prediction.rename(
-            columns={'Time': 'SOME NON-STANDARD KEY'})
-
-        self.assertRaisesRegex(
-            ValueError, 'Data does not have the key <Time>.',
-            self.fig.add_prediction, data)
-
-    def test_add_prediction_wrong_obs_key(self):
-        # Rename observable key
-        data = self.prediction.rename(
-            columns={'Observable': 'SOME NON-STANDARD KEY'})
-
-        self.assertRaisesRegex(
-            ValueError, 'Data does not have the key <Observable>.',
-            self.fig.add_prediction, data)
-
-    def test_add_prediction_wrong_value_key(self):
-        # Rename value key
-        data = self.prediction.rename(
-            columns={'Value': 'SOME NON-STANDARD KEY'})
-
-        self.assertRaisesRegex(
-            ValueError, 'Data does not have the key <Value>.',
-            self.fig.add_prediction, data)
-
     def test_add_prediction_biom_mapping(self):
-        # Rename rename observable
-        data = self.prediction.copy()
-        data['Observable'] = 'SOME NON-STANDARD observable'
+        # Rename observable
+        data = self.prediction.assign(
+            Observable='SOME NON-STANDARD observable')
 
         # Test that it works with correct mapping
         self.fig.add_prediction(
@@ -449,54 +317,10 @@ class TestPKPredictivePlot(unittest.TestCase):
             self.fig.add_prediction(
                 data=data, observable='SOME WRONG observable')
 
-    def test_add_prediction_no_provided_bulk_prob(self):
-        # Test that it works with correct mapping
-        self.fig.add_prediction(data=self.prediction, bulk_probs=None)
-
-        trace = self.fig._fig.data[-1]
-        self.assertIsInstance(trace, go.Scatter)
-
-    def test_add_prediction_time_key_mapping(self):
-        # Rename time key
-        data = self.prediction.rename(
-            columns={'Time': 'SOME NON-STANDARD KEY'})
-
-        # Test that it works with correct mapping
-        self.fig.add_prediction(data=data, time_key='SOME NON-STANDARD KEY')
-
-        # Test that it fails with wrong mapping
-        with self.assertRaisesRegex(
-                ValueError, 'Data does not have the key <SOME WRONG KEY>.'):
-            self.fig.add_prediction(data=data, time_key='SOME WRONG KEY')
-
-    def test_add_prediction_obs_key_mapping(self):
-        # Rename observable key
-        data = self.prediction.rename(
-            columns={'Observable': 'SOME NON-STANDARD KEY'})
-
-        # Test that it works with correct mapping
-        self.fig.add_prediction(data=data, obs_key='SOME NON-STANDARD KEY')
-
-        # Test that it fails with wrong mapping
-        with self.assertRaisesRegex(
-                ValueError, 'Data does not have the key <SOME WRONG KEY>.'):
-            self.fig.add_prediction(data=data, obs_key='SOME WRONG KEY')
-
-    def test_add_prediction_value_key_mapping(self):
-        # Rename value key
-        data = self.prediction.rename(
-            columns={'Value': 'SOME NON-STANDARD KEY'})
-
-        # Test that it works with correct mapping
-        self.fig.add_prediction(data=data, value_key='SOME NON-STANDARD KEY')
-
-        # Test that it fails with wrong mapping
-        with self.assertRaisesRegex(
-                ValueError, 'Data does not have the key <SOME WRONG KEY>.'):
-            self.fig.add_prediction(data=data, value_key='SOME WRONG KEY')
-
 
-class TestPDTimeSeriesPlot(unittest.TestCase):
+@key_tests('add_data', DATA_KEYS)
+@key_tests('add_simulation', SIMULATION_KEYS)
+class TestPDTimeSeriesPlot(KeyValidationMixin, unittest.TestCase):
     """
     Tests the chi.plots.PDTimeSeriesPlot class.
     """
@@ -504,18 +328,18 @@ class TestPDTimeSeriesPlot(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
         # Create test dataset
-        cls.data = DataLibrary().lung_cancer_control_group()
+        cls.data = lung_cancer_control_group()
+
+        # Rename each key of the dataset once
+        cls.data_renamed = {
+            key: renamed_dataset(lung_cancer_control_group, key)
+            for key in DATA_KEYS}
 
         # Create test figure
         cls.fig = plots.PDTimeSeriesPlot()
 
     def test_add_data_wrong_data_type(self):
-        # Create data of wrong type
-        data = np.ones(shape=(10, 4))
-
-        self.assertRaisesRegex(
-            TypeError, 'Data has to be pandas.DataFrame.',
-            self.fig.add_data, data)
+        self._check_wrong_data_type(self.fig.add_data)
 
     def test_add_data_wrong_observable(self):
         observable = 'Does not exist'
@@ -523,141 +347,12 @@ class TestPDTimeSeriesPlot(unittest.TestCase):
         with self.assertRaisesRegex(ValueError, 'The observable could not be'):
             self.fig.add_data(self.data, observable)
 
-    def test_add_data_wrong_id_key(self):
-        # Rename ID key
-        data = self.data.rename(columns={'ID': 'SOME NON-STANDARD KEY'})
-
-        self.assertRaisesRegex(
-            ValueError, 'Data does not have the key <ID>.',
-            self.fig.add_data, data)
-
-    def test_add_data_wrong_time_key(self):
-        # Rename time key
-        data = self.data.rename(columns={'Time': 'SOME NON-STANDARD KEY'})
-
-        self.assertRaisesRegex(
-            ValueError, 'Data does not have the key <Time>.',
-            self.fig.add_data, data)
-
-    def test_add_data_wrong_obs_key(self):
-        # Rename observable key
-        data = self.data.rename(
-            columns={'Observable': 'SOME NON-STANDARD KEY'})
-
-        self.assertRaisesRegex(
-            ValueError, 'Data does not have the key <Observable>.',
-            self.fig.add_data, data)
-
-    def test_add_data_wrong_value_key(self):
-        # Rename Value key
-        data = self.data.rename(
-            columns={'Value': 'SOME NON-STANDARD KEY'})
-
-        self.assertRaisesRegex(
-            ValueError, 'Data does not have the key <Value>.',
-            self.fig.add_data, data)
-
-    def test_add_data_id_key_mapping(self):
-        # Rename ID key
-        data = self.data.rename(columns={'ID': 'SOME NON-STANDARD KEY'})
-
-        # Test that it works with correct mapping
-        self.fig.add_data(data=data, id_key='SOME NON-STANDARD KEY')
-
-        # Test that it fails with wrong mapping
-        with self.assertRaisesRegex(
-                ValueError, 'Data does not have the key <SOME WRONG KEY>.'):
-            self.fig.add_data(data=data, id_key='SOME WRONG KEY')
-
-    def test_add_data_time_key_mapping(self):
-        # Rename time key
-        data = self.data.rename(columns={'Time': 'SOME NON-STANDARD KEY'})
-
-        # Test that it works with correct mapping
-        self.fig.add_data(data=data, time_key='SOME NON-STANDARD KEY')
-
-        # Test that it fails with wrong mapping
-        with self.assertRaisesRegex(
-                ValueError, 'Data does not have the key <SOME WRONG KEY>.'):
-            self.fig.add_data(data=data, time_key='SOME WRONG KEY')
-
-    def test_add_data_obs_key_mapping(self):
-        # Rename observable key
-        data = self.data.rename(
-            columns={'Observable': 'SOME NON-STANDARD KEY'})
-
-        # Test that it works with correct mapping
-        self.fig.add_data(data=data, obs_key='SOME NON-STANDARD KEY')
-
-        # Test that it fails with wrong mapping
-        with self.assertRaisesRegex(
-                ValueError, 'Data does not have the key <SOME WRONG KEY>.'):
-            self.fig.add_data(data=data, obs_key='SOME WRONG KEY')
-
-    def test_add_data_value_key_mapping(self):
-        # Rename Value key
-        data = self.data.rename(
-            columns={'Value': 'SOME NON-STANDARD KEY'})
-
-        # Test that it works with correct mapping
-        self.fig.add_data(data=data, value_key='SOME NON-STANDARD KEY')
-
-        # Test that it fails with wrong mapping
-        with self.assertRaisesRegex(
-                ValueError, 'Data does not have the key <SOME WRONG KEY>.'):
-            self.fig.add_data(data=data, value_key='SOME WRONG KEY')
-
     def test_add_simulation_wrong_data_type(self):
-        # Create data of wrong type
-        data = np.ones(shape=(10, 4))
-
-        self.assertRaisesRegex(
-            TypeError, 'Data has to be pandas.DataFrame.',
-            self.fig.add_simulation, data)
-
-    def test_add_simulation_wrong_time_key(self):
-        # Rename time key
-        data = self.data.rename(columns={'Time': 'SOME NON-STANDARD KEY'})
-
-        self.assertRaisesRegex(
-            ValueError, 'Data does not have the key <Time>.',
-            self.fig.add_simulation, data)
-
-    def test_add_simulation_wrong_value_key(self):
-        # Rename value key
-        data = self.data.rename(columns={'Value': 'SOME NON-STANDARD KEY'})
-
-        self.assertRaisesRegex(
-            ValueError, 'Data does not have the key <Value>.',
-            self.fig.add_simulation, data)
-
-    def test_add_simulation_time_key_mapping(self):
-        # Rename time key
-        data = self.data.rename(columns={'Time': 'SOME NON-STANDARD KEY'})
-
-        # Test that it works with correct mapping
-        self.fig.add_simulation(data=data, time_key='SOME NON-STANDARD KEY')
-
-        # Test that it fails with wrong mapping
-        with self.assertRaisesRegex(
-                ValueError, 'Data does not have the key <SOME WRONG KEY>.'):
-            self.fig.add_simulation(data=data, time_key='SOME WRONG KEY')
-
-    def test_add_simulation_value_key_mapping(self):
-        # Rename value key
-        data = self.data.rename(
-            columns={'Value': 'SOME NON-STANDARD KEY'})
+        self._check_wrong_data_type(self.fig.add_simulation)
 
-        # Test that it works with correct mapping
-        self.fig.add_simulation(data=data, value_key='SOME NON-STANDARD KEY')
-
-        # Test that it fails with wrong mapping
-        with self.assertRaisesRegex(
-                ValueError, 'Data does not have the key <SOME WRONG KEY>.'):
-            self.fig.add_simulation(data=data, value_key='SOME WRONG KEY')
 
-
-class TestPKTimeSeriesPlot(unittest.TestCase):
+@key_tests('add_data', PK_DATA_KEYS)
+class TestPKTimeSeriesPlot(KeyValidationMixin, unittest.TestCase):
     """
     Tests the chi.plots.PKTimeSeriesPlot class.
     """
@@ -665,18 +360,18 @@ class TestPKTimeSeriesPlot(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
         # Create test dataset
-        cls.data = DataLibrary().lung_cancer_low_erlotinib_dose_group()
+        cls.data = lung_cancer_low_erlotinib_dose_group()
+
+        # Rename each key of the dataset once
+        cls.data_renamed = {
+            key: renamed_dataset(lung_cancer_low_erlotinib_dose_group, key)
+            for key in PK_DATA_KEYS}
 
         # Create test figure
         cls.fig = plots.PKTimeSeriesPlot()
 
     def test_add_data_wrong_data_type(self):
-        # Create data of wrong type
-        data = np.ones(shape=(10, 4))
-
-        self.assertRaisesRegex(
-            TypeError, 'Data has to be pandas.DataFrame.',
-            self.fig.add_data, data)
+        self._check_wrong_data_type(self.fig.add_data)
 
     def test_add_data_wrong_observable(self):
         observable = 'Does not exist'
@@ -684,110 +379,6 @@ class TestPKTimeSeriesPlot(unittest.TestCase):
         with self.assertRaisesRegex(ValueError, 'The observable could not be'):
             self.fig.add_data(self.data, observable)
 
-    def test_add_data_wrong_id_key(self):
-        # Rename ID key
-        data = self.data.rename(columns={'ID': 'SOME NON-STANDARD KEY'})
-
-        self.assertRaisesRegex(
-            ValueError, 'Data does not have the key <ID>.',
-            self.fig.add_data, data)
-
-    def test_add_data_wrong_time_key(self):
-        # Rename time key
-        data = self.data.rename(columns={'Time': 'SOME NON-STANDARD KEY'})
-
-        self.assertRaisesRegex(
-            ValueError, 'Data does not have the key <Time>.',
-            self.fig.add_data, data)
-
-    def test_add_data_wrong_obs_key(self):
-        # Rename observable key
-        data = self.data.rename(
-            columns={'Observable': 'SOME NON-STANDARD KEY'})
-
-        self.assertRaisesRegex(
-            ValueError, 'Data does not have the key <Observable>.',
-            self.fig.add_data, data)
-
-    def test_add_data_wrong_value_key(self):
-        # Rename Value key
-        data = self.data.rename(
-            columns={'Value': 'SOME NON-STANDARD KEY'})
-
-        self.assertRaisesRegex(
-            ValueError, 'Data does not have the key <Value>.',
-            self.fig.add_data, data)
-
-    def test_add_data_wrong_dose_key(self):
-        # Rename dose key
-        data = self.data.rename(columns={'Dose': 'SOME NON-STANDARD KEY'})
-
-        self.assertRaisesRegex(
-            ValueError, 'Data does not have the key <Dose>.',
-            self.fig.add_data, data)
-
-    def test_add_data_id_key_mapping(self):
-        # Rename ID key
-        data = self.data.rename(columns={'ID': 'SOME NON-STANDARD KEY'})
-
-        # Test that it works with correct mapping
-        self.fig.add_data(data=data, id_key='SOME NON-STANDARD KEY')
-
-        # Test that it fails with wrong mapping
-        with self.assertRaisesRegex(
-                ValueError, 'Data does not have the key <SOME WRONG KEY>.'):
-            self.fig.add_data(data=data, id_key='SOME WRONG KEY')
-
-    def test_add_data_time_key_mapping(self):
-        # Rename time key
-        data = self.data.rename(columns={'Time': 'SOME NON-STANDARD KEY'})
-
-        # Test that it works with correct mapping
-        self.fig.add_data(data=data, time_key='SOME NON-STANDARD KEY')
-
-        # Test that it fails with wrong mapping
-        with self.assertRaisesRegex(
-                ValueError, 'Data does not have the key <SOME WRONG KEY>.'):
-            self.fig.add_data(data=data, time_key='SOME WRONG KEY')
-
-    def test_add_data_obs_key_mapping(self):
-        # Rename observable key
-        data = self.data.rename(
-            columns={'Observable': 'SOME NON-STANDARD KEY'})
-
-        # Test that it works with correct mapping
-        self.fig.add_data(data=data, obs_key='SOME NON-STANDARD KEY')
-
-        # Test that it fails with wrong mapping
-        with self.assertRaisesRegex(
-                ValueError, 'Data does not have the key <SOME WRONG KEY>.'):
-            self.fig.add_data(data=data, obs_key='SOME WRONG KEY')
-
-    def test_add_data_dose_key_mapping(self):
-        # Rename dose key
-        data = self.data.rename(columns={'Dose': 'SOME NON-STANDARD KEY'})
-
-        # Test that it works with correct mapping
-        self.fig.add_data(data=data, dose_key='SOME NON-STANDARD KEY')
-
-        # Test that it fails with wrong mapping
-        with self.assertRaisesRegex(
-                ValueError, 'Data does not have the key <SOME WRONG KEY>.'):
-            self.fig.add_data(data=data, dose_key='SOME WRONG KEY')
-
-    def test_add_data_value_key_mapping(self):
-        # Rename Value key
-        data = self.data.rename(
-            columns={'Value': 'SOME NON-STANDARD KEY'})
-
-        # Test that it works with correct mapping
-        self.fig.add_data(data=data, value_key='SOME NON-STANDARD KEY')
-
-        # Test that it fails with wrong mapping
-        with self.assertRaisesRegex(
-                ValueError, 'Data does not have the key <SOME WRONG KEY>.'):
-            self.fig.add_data(data=data, value_key='SOME WRONG KEY')
-
     def test_add_simulation(self):
         with self.assertRaisesRegex(NotImplementedError, ''):
             self.fig.add_simulation(self.data)
@@ -16,6 +16,22 @@ import chi
 from chi.library import ModelLibrary
 
 
+class RecordingPopulationPredictiveModel(chi.PopulationPredictiveModel):
+    """
+    A population predictive model that records the covariates of each
+    sample call.
+    """
+    def __init__(self, predictive_model, population_model):
+        super(RecordingPopulationPredictiveModel, self).__init__(
+            predictive_model, population_model)
+        self.covariates = []
+
+    def sample(self, *args, **kwargs):
+        self.covariates.append(kwargs.get('covariates'))
+        return super(RecordingPopulationPredictiveModel, self).sample(
+            *args, **kwargs)
+
+
 class TestAveragedPredictiveModel(unittest.TestCase):
     """
     Tests the chi.AveragedPredictiveModel class.
@@ -142,6 +158,13 @@ class TestPosteriorPredictiveModel(unittest.TestCase):
         cls.pop_model2 = chi.PosteriorPredictiveModel(
             cls.pred_pop_model2, cls.pop_post_samples2)
 
+        # Create posterior predictive model that records the covariates of
+        # each draw
+        cls.recording_pred_pop_model = RecordingPopulationPredictiveModel(
+            cls.pred_model, pop_model)
+        cls.recording_pop_model = chi.PosteriorPredictiveModel(
+            cls.recording_pred_pop_model, cls.pop_post_samples2)
+
     def test_bad_instantiation(self):
         # Posterior samples have the wrong type
         posterior_samples = 'Bad type'
@@ -252,6 +275,17 @@ class TestPosteriorPredictiveModel(unittest.TestCase):
         values = samples['Value'].unique()
         self.assertEqual(len(values), 20)
 
+        # Test case II.2: Return samples as numpy array
+        samples = self.model.sample(
+            times, n_samples=n_samples, seed=seed, return_df=False)
+
+        self.assertIsInstance(samples, np.ndarray)
+        self.assertEqual(samples.shape, (1, 5, n_samples))
+
+        df = self.model.sample(times, n_samples=n_samples, seed=seed)
+        self.assertTrue(np.allclose(
+            samples.transpose(2, 0, 1).flatten(), df['Value'].values))
+
         # Test case III: include dosing regimen
 
         # Test case III.1: PD model
@@ -513,6 +547,40 @@ class TestPosteriorPredictiveModel(unittest.TestCase):
         with self.assertRaisesRegex(ValueError, 'The individual <some ID>'):
             self.model.sample(times, individual=_id)
 
+        # The covariates per sample do not match n_samples
+        covariates = np.ones(shape=(2, 2))
+        with self.assertRaisesRegex(ValueError, 'Provided covariates cannot'):
+            self.pop_model2.sample(
+                times, n_samples=3, covariates=covariates)
+
+    def test_sample_covariates_per_sample(self):
+        # Each draw is sampled with the covariates of its sample
+        n_samples = 3
+        n_cov = 2
+        times = [1, 2, 3, 4, 5]
+        covariates = \
+            np.arange(n_samples * n_cov).reshape(n_samples, n_cov) + 0.1
+        self.recording_pred_pop_model.covariates = []
+        self.recording_pop_model.sample(
+            times, n_samples=n_samples, covariates=covariates, seed=2)
+
+        recorded = self.recording_pred_pop_model.covariates
+        self.assertEqual(len(recorded), n_samples)
+        for sample_id in range(n_samples):
+            np.testing.assert_array_equal(
+                recorded[sample_id], covariates[sample_id])
+
+        # Covariates of shape (n_cov,) are used for all draws
+        self.recording_pred_pop_model.covariates = []
+        self.recording_pop_model.sample(
+            times, n_samples=n_samples, covariates=covariates[1], seed=2)
+
+        recorded = self.recording_pred_pop_model.covariates
+        self.assertEqual(len(recorded), n_samples)
+        for sample_id in range(n_samples):
+            np.testing.assert_array_equal(
+                recorded[sample_id], covariates[1])
+
 
 class TestPredictiveModel(unittest.TestCase):
     """
@@ -828,6 +896,43 @@ class TestPredictiveModel(unittest.TestCase):
         self.assertEqual(len(doses), 1)
         self.assertEqual(doses[0], 1)
 
+        # Test case II.5 Indefinite dosing regimen starting at 0
+        # (Dose events at the final time are registered)
+        model.set_dosing_regimen(dose=1, start=0, period=2)
+        regimen_df = model.get_dosing_regimen(final_time=10)
+
+        times = regimen_df['Time'].to_numpy()
+        self.assertEqual(len(times), 6)
+        self.assertEqual(times[0], 0)
+        self.assertEqual(times[1], 2)
+        self.assertEqual(times[2], 4)
+        self.assertEqual(times[3], 6)
+        self.assertEqual(times[4], 8)
+        self.assertEqual(times[5], 10)
+
+        # Final time at the start of the regimen
+        regimen_df = model.get_dosing_regimen(final_time=0)
+
+        times = regimen_df['Time'].to_numpy()
+        self.assertEqual(len(times), 1)
+        self.assertEqual(times[0], 0)
+
+        # Test case II.6 Multiple doses starting at 0
+        model.set_dosing_regimen(dose=1, start=0, period=2, num=3)
+        regimen_df = model.get_dosing_regimen(final_time=4)
+
+        times = regimen_df['Time'].to_numpy()
+        self.assertEqual(len(times), 3)
+        self.assertEqual(times[0], 0)
+        self.assertEqual(times[1], 2)
+        self.assertEqual(times[2], 4)
+
+        regimen_df = model.get_dosing_regimen(final_time=0)
+
+        times = regimen_df['Time'].to_numpy()
+        self.assertEqual(len(times), 1)
+        self.assertEqual(times[0], 0)
+
     def test_get_submodels(self):
         # Test case I: no fixed parameters
         submodels = self.model.get_submodels()
@@ -1012,6 +1117,30 @@ class TestPredictiveModel(unittest.TestCase):
         self.assertAlmostEqual(samples[0, 4, 2], 1.364551743048893)
         self.assertAlmostEqual(samples[0, 4, 3], 0.5143221311427919)
 
+        # Test case II.3: Write samples into provided array
+        out = np.empty(shape=(n_outputs, n_times, n_samples))
+        samples = self.model.sample(
+            parameters, times, n_samples=n_samples, seed=seed,
+            return_df=False, out=out)
+
+        self.assertIs(samples, out)
+        self.assertAlmostEqual(out[0, 0, 0], 1.0556423390683263)
+        self.assertAlmostEqual(out[0, 4, 3], 0.5143221311427919)
+
+        # Test case II.4: Multi-output model, noise of outputs is not
+        # correlated
+        model = ModelLibrary().one_compartment_pk_model()
+        model.set_administration('central', direct=False)
+        model.set_outputs(['central.drug_amount', 'dose.drug_amount'])
+        error_models = [chi.GaussianErrorModel(), chi.GaussianErrorModel()]
+        model = chi.PredictiveModel(model, error_models)
+        samples = model.sample(
+            [0, 0, 1, 1, 1, 1, 1], times, n_samples=n_samples, seed=seed,
+            return_df=False)
+
+        self.assertEqual(samples.shape, (2, n_times, n_samples))
+        self.assertFalse(np.allclose(samples[0], samples[1]))
+
         # Test case III: Return dosing regimen
 
         # Test case III.1: PDModel, dosing regimen is not returned even
@@ -1195,6 +1324,17 @@ class TestPredictiveModel(unittest.TestCase):
         with self.assertRaisesRegex(ValueError, 'The length of parameters'):
             self.model.sample(parameters, times)
 
+        # Output container has the wrong type
+        parameters = [1, 1, 1, 1, 1, 1, 0.1]
+        out = np.empty(shape=(1, 4, 1), dtype=int)
+        with self.assertRaisesRegex(TypeError, 'The output container'):
+            self.model.sample(parameters, times, out=out)
+
+        # Output container has the wrong shape
+        out = np.empty(shape=(1, 4, 2))
+        with self.assertRaisesRegex(ValueError, 'The shape of the output'):
+            self.model.sample(parameters, times, out=out)
+
 
 class TestPopulationPredictiveModel(unittest.TestCase):
     """
@@ -1483,6 +1623,16 @@ class TestPopulationPredictiveModel(unittest.TestCase):
         n_times = 5
         self.assertEqual(samples.shape, (n_outputs, n_times, n_samples))
 
+        # Test case II.3: Write samples into provided array
+        out = np.empty(shape=(n_outputs, n_times, n_samples))
+        ref = samples
+        samples = self.model.sample(
+            parameters, times, n_samples=n_samples, seed=seed,
+            return_df=False, out=out)
+
+        self.assertIs(samples, out)
+        self.assertTrue(np.allclose(out, ref))
+
         # Test case III: Return dosing regimen
 
         # Test case III.1: PDModel, dosing regimen is not returned even
@@ -1717,6 +1867,13 @@ class TestPopulationPredictiveModel(unittest.TestCase):
                 parameters, times, seed=seed, covariates=covariates,
                 n_samples=n_samples)
 
+        # Output container has the wrong shape
+        parameters = [1, 1, 1, 1, 1, 1, 1, 0.1, 0.1]
+        out = np.empty(shape=(1, 5, 2))
+        with self.assertRaisesRegex(ValueError, 'The shape of the output'):
+            self.model.sample(
+                parameters, times, seed=seed, n_samples=n_samples, out=out)
+
 
 class TestPriorPredictiveModel(unittest.TestCase):
     """
@@ -1819,6 +1976,14 @@ class TestPriorPredictiveModel(unittest.TestCase):
         cls.prior_pop_pred_model2 = chi.PriorPredictiveModel(
             pop_predictive_model2, pop_log_prior2)
 
+        # Create prior predictive model that records the covariates of each
+        # draw
+        cls.recording_pop_predictive_model = \
+            RecordingPopulationPredictiveModel(
+                cls.predictive_model, population_models)
+        cls.recording_prior_pop_pred_model = chi.PriorPredictiveModel(
+            cls.recording_pop_predictive_model, pop_log_prior2)
+
     def test_bad_instantiation(self):
         # Predictive model has wrong type
         predictive_model = 'wrong type'
@@ -1908,6 +2073,24 @@ class TestPriorPredictiveModel(unittest.TestCase):
         values = samples['Value'].unique()
         self.assertEqual(len(values), 20)
 
+        # Test case II.2: Return samples as numpy array
+        samples = self.model.sample(
+            times, n_samples=n_samples, seed=seed, return_df=False)
+
+        self.assertIsInstance(samples, np.ndarray)
+        self.assertEqual(samples.shape, (1, 5, n_samples))
+
+        df = self.model.sample(times, n_samples=n_samples, seed=seed)
+        self.assertTrue(np.allclose(
+            samples.transpose(2, 0, 1).flatten(), df['Value'].values))
+
+        # Test case II.3: Seeding does not change the global random state
+        np.random.seed(seed)
+        expected = np.random.uniform()
+        np.random.seed(seed)
+        self.model.sample(times, n_samples=n_samples, seed=seed)
+        self.assertEqual(np.random.uniform(), expected)
+
         # Test case III: include dosing regimen
 
         # Test case III.1: PD model
@@ -2099,6 +2282,61 @@ class TestPriorPredictiveModel(unittest.TestCase):
         values = samples['Value'].unique()
         self.assertEqual(len(values), 5)
 
+        # Test case VI: Population model with covariates for each sample
+        n_samples = 3
+        n_cov = 2
+        covariates = \
+            np.arange(n_samples * n_cov).reshape(n_samples, n_cov) + 0.1
+        samples = self.prior_pop_pred_model2.sample(
+            times, n_samples=n_samples, seed=seed, covariates=covariates)
+
+        self.assertIsInstance(samples, pd.DataFrame)
+
+        sample_ids = samples['ID'].unique()
+        self.assertEqual(len(sample_ids), n_samples)
+        self.assertEqual(sample_ids[0], 1)
+        self.assertEqual(sample_ids[1], 2)
+        self.assertEqual(sample_ids[2], 3)
+
+        values = samples['Value'].unique()
+        self.assertEqual(len(values), 15)
+
+    def test_sample_bad_input(self):
+        # The covariates per sample do not match n_samples
+        times = [1, 2, 3, 4, 5]
+        covariates = np.ones(shape=(2, 2))
+        with self.assertRaisesRegex(ValueError, 'Provided covariates cannot'):
+            self.prior_pop_pred_model2.sample(
+                times, n_samples=3, covariates=covariates)
+
+    def test_sample_covariates_per_sample(self):
+        # Each draw is sampled with the covariates of its sample
+        n_samples = 3
+        n_cov = 2
+        times = [1, 2, 3, 4, 5]
+        covariates = \
+            np.arange(n_samples * n_cov).reshape(n_samples, n_cov) + 0.1
+        self.recording_pop_predictive_model.covariates = []
+        self.recording_prior_pop_pred_model.sample(
+            times, n_samples=n_samples, covariates=covariates, seed=2)
+
+        recorded = self.recording_pop_predictive_model.covariates
+        self.assertEqual(len(recorded), n_samples)
+        for sample_id in range(n_samples):
+            np.testing.assert_array_equal(
+                recorded[sample_id], covariates[sample_id])
+
+        # Covariates of shape (n_cov,) are used for all draws
+        self.recording_pop_predictive_model.covariates = []
+        self.recording_prior_pop_pred_model.sample(
+            times, n_samples=n_samples, covariates=covariates[1], seed=2)
+
+        recorded = self.recording_pop_predictive_model.covariates
+        self.assertEqual(len(recorded), n_samples)
+        for sample_id in range(n_samples):
+            np.testing.assert_array_equal(
+                recorded[sample_id], covariates[1])
+
 
 class TestPAMPredictiveModel(unittest.TestCase):
     """
@@ -2319,6 +2557,20 @@ class TestPAMPredictiveModel(unittest.TestCase):
         values = samples['Value'].unique()
         self.assertEqual(len(values), 20)
 
+        # Test case II.2: Return samples as numpy array
+        # (The models are drawn with numpy's global random state)
+        np.random.seed(seed)
+        samples = self.stacked_model.sample(
+            times, n_samples=n_samples, seed=seed, return_df=False)
+
+        self.assertIsInstance(samples, np.ndarray)
+        self.assertEqual(samples.shape, (1, 5, n_samples))
+
+        np.random.seed(seed)
+        df = self.stacked_model.sample(times, n_samples=n_samples, seed=seed)
+        self.assertTrue(np.allclose(
+            samples.transpose(2, 0, 1).flatten(), df['Value'].values))
+
         # Test case III: include dosing regimen
         # Test case III.1: First model is PD model
         samples = self.stacked_model.sample(times, include_regimen=True)